@@ -4,17 +4,37 @@ from fastapi import Request
 import hmac
 import hashlib
 
-from core.config import Config
+from core.clients import get_config
 
-_cfg = Config()
+_cfg = get_config()
+# Encoded once; every webhook compares against these bytes
+_SECRET_BYTES = (_cfg.webhook_secret or "").encode("utf-8")
+
+_SECRET_LEN = len(_SECRET_BYTES)
+# Outbound callbacks are signed with their own key (never the inbound secret)
+_COMPLETION_KEY = (_cfg.completion_webhook_secret or "").encode("utf-8")
+_SECRET_HEADER = b"x-webhook-secret"  # ASGI servers deliver header names lower-cased
 
 def verify_header_secret(request: Request) -> bool:
     """
     Simple shared check. Compares the X header to your configured secret.
+    A wrong-length value is rejected before the constant-time compare (this only
+    reveals the secret's length, never its content).
+    """
+    sent = b""
+    for name, value in request.headers.raw:
+        if name == _SECRET_HEADER:
+            sent = value
+            break
+    return len(sent) == _SECRET_LEN and hmac.compare_digest(sent, _SECRET_BYTES)
+
+def sign_body(raw_body: bytes) -> str:
+    """
+    Signature for bodies we send out (completion callbacks):
+    'sha256=<hex HMAC-SHA256 of the body keyed with COMPLETION_WEBHOOK_SECRET>'.
+    Callers must not send callbacks when that secret is unset.
     """
-    sent = request.headers.get("x-webhook-secret", "") or ""
-    expected = _cfg.webhook_secret or ""
-    return hmac.compare_digest(sent, expected)
+    return "sha256=" + hmac.new(_COMPLETION_KEY, raw_body or b"", hashlib.sha256).hexdigest()
 
 def verify_hmac_body(raw_body: bytes, signature_header: str | None) -> bool:
     """
@@ -24,6 +44,5 @@ def verify_hmac_body(raw_body: bytes, signature_header: str | None) -> bool:
     if not signature_header:
         return False
     provided = signature_header.replace("sha256=", "")
-    secret = (_cfg.webhook_secret or "").encode()
-    digest = hashlib.sha256(secret + (raw_body or b"")).hexdigest()
+    digest = hashlib.sha256(_SECRET_BYTES + (raw_body or b"")).hexdigest()
     return hmac.compare_digest(provided, digest)
\ No newline at end of file
@@ -2,12 +2,20 @@
 """FastAPI server with specialized webhook endpoints"""
 from __future__ import annotations
 
-from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
-
-from core.config import Config
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any, Callable
+
+import orjson
+import requests
+from fastapi import BackgroundTasks, FastAPI, Request, HTTPException
+from fastapi.responses import ORJSONResponse
+
+from core.clients import get_config, get_jira
 from core.logging import logger
-from app.auth import verify_header_secret
+from app.auth import sign_body, verify_header_secret
 from app.webhook_handlers import (
     handle_l1_triage,
     handle_admin_validator,
@@ -15,108 +23,235 @@ from app.webhook_handlers import (
     handle_hygiene,
 )
 
-# health deps
 from tools.jira_api import JiraAPI
+from llm.provider import LLMProvider
 from llm.ollama_client import test_ollama_connection
 
-app = FastAPI(title="Jira Simple Agents", version="1.0.0")
-config = Config()
+config = get_config()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Dedicated pool for blocking Jira/Ollama work, sized independently of
+    # Starlette's default threadpool limiter.
+    app.state.executor = ThreadPoolExecutor(
+        max_workers=config.webhook_worker_threads, thread_name_prefix="webhook"
+    )
+    # Long-lived clients shared by every webhook (JiraAPI keeps one HTTP session and
+    # probes /myself on construction, so build it once per process, off the event
+    # loop, at startup rather than at import). Without Jira settings an
+    # unconfigured client still lets /health report the problem.
+    app.state.jira = await _offload(lambda: get_jira() or JiraAPI(config))
+    app.state.llm = LLMProvider(config)
+    try:
+        yield
+    finally:
+        app.state.executor.shutdown(wait=False, cancel_futures=True)
+
+
+app = FastAPI(
+    title="Jira Simple Agents",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+
+# Completion callbacks reuse one connection pool
+_callback_session = requests.Session()
+CALLBACK_TIMEOUT_SEC = 10
+# Callbacks are HMAC-signed with their own key; without it they aren't sent at all
+_SEND_COMPLETIONS = bool(config.completion_webhook_url and config.completion_webhook_secret)
+if config.completion_webhook_url and not config.completion_webhook_secret:
+    logger.warning("completion_callbacks_disabled",
+                   extra={"reason": "COMPLETION_WEBHOOK_URL is set but COMPLETION_WEBHOOK_SECRET is not"})
+
+# Jira issue payloads are typically well under 100 KB; anything far larger is
+# rejected before it is buffered or parsed.
+MAX_WEBHOOK_BODY_BYTES = 1_000_000
+
+
+async def _read_body(request: Request) -> bytes:
+    """Read the raw request body, enforcing MAX_WEBHOOK_BODY_BYTES (413 otherwise)."""
+    try:
+        declared = int(request.headers.get("content-length") or 0)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid Content-Length")
+    if declared > MAX_WEBHOOK_BODY_BYTES:
+        raise HTTPException(status_code=413, detail="Payload too large")
+
+    body = await request.body()
+    if len(body) > MAX_WEBHOOK_BODY_BYTES:
+        raise HTTPException(status_code=413, detail="Payload too large")
+    return body
+
+
+def _parse_json(body: bytes) -> Any:
+    """Parse an already-buffered body with orjson (400 on malformed JSON)."""
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+
+
+async def _offload(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run blocking work on the app executor so the event loop stays free."""
+    executor = getattr(app.state, "executor", None)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(fn, *args, **kwargs))
+
 
+# In-flight webhook runs keyed by (endpoint, issue key). Jira redeliveries that
+# arrive while the first delivery is still queued/processing are not run again.
+_INFLIGHT: set[tuple[str, str]] = set()
 
-@app.post("/api/v1/l1-triage-bot")
-async def l1_triage_webhook(request: Request):
+
+def _enqueue(background: BackgroundTasks, kind: str, issue_key: str,
+             handler: Callable[..., dict], data: dict) -> str:
+    """
+    Schedule a (blocking) handler to run after the response is sent.
+    Returns "queued", or "in_progress" if the same endpoint + issue key is
+    already queued or running.
+    """
+    key = (kind, issue_key)
+    if key in _INFLIGHT:
+        logger.info("webhook_redelivery_skipped", extra={"kind": kind, "issue_key": issue_key})
+        return "in_progress"
+
+    _INFLIGHT.add(key)
+    background.add_task(_run_inflight, key, handler, data)
+    return "queued"
+
+
+def _post_completion(kind: str, issue_key: str, result: Any) -> None:
+    """POST a finished background result to COMPLETION_WEBHOOK_URL (HMAC-signed, see sign_body)."""
+    body = orjson.dumps(
+        {"kind": kind, "issue_key": issue_key, "result": result}, default=str
+    )
+    try:
+        resp = _callback_session.post(
+            config.completion_webhook_url,
+            data=body,
+            headers={"Content-Type": "application/json", "X-Signature": sign_body(body)},
+            timeout=CALLBACK_TIMEOUT_SEC,
+        )
+        if resp.status_code >= 300:
+            logger.warning("completion_callback_rejected",
+                           extra={"kind": kind, "issue_key": issue_key, "status": resp.status_code})
+    except Exception as e:
+        logger.warning("completion_callback_failed",
+                       extra={"kind": kind, "issue_key": issue_key, "error": str(e)})
+
+
+async def _run_inflight(key: tuple[str, str], handler: Callable[..., dict], data: dict) -> None:
+    kind, issue_key = key
+    try:
+        result = await _offload(handler, data, config, jira=app.state.jira, llm=app.state.llm)
+        logger.info("webhook_finished", extra={"kind": kind, "issue_key": issue_key})
+    except Exception as e:
+        logger.error("webhook_failed", extra={"kind": kind, "issue_key": issue_key, "error": str(e)})
+        return
+    finally:
+        _INFLIGHT.discard(key)
+
+    # Outside the in-flight window: a slow callback receiver mustn't block redeliveries
+    if _SEND_COMPLETIONS:
+        await _offload(_post_completion, kind, issue_key, result)
+
+
+@app.post("/api/v1/l1-triage-bot", status_code=202)
+async def l1_triage_webhook(request: Request, background: BackgroundTasks):
     """
     L1 Triage Bot - Incident support
     """
     # read raw early so HMAC/hardening is possible later
-    _ = await request.body()
+    body = await _read_body(request)
 
     if not verify_header_secret(request):
         raise HTTPException(status_code=401, detail="Invalid webhook secret")
 
     try:
-        data = await request.json()
+        data = _parse_json(body)
         issue = data.get("issue", {})
         issue_key = issue.get("key")
         if not issue_key:
             raise HTTPException(status_code=400, detail="No issue key provided")
 
-        logger.info(f"L1 Triage webhook received for {issue_key}")
-        result = handle_l1_triage(data, config)
+        logger.info("l1_webhook_received", extra={"issue_key": issue_key})
+        status = _enqueue(background, "l1_triage", issue_key, handle_l1_triage, data)
 
         return {
             "received": True,
             "issue_key": issue_key,
-            "result": result,
+            "status": status,
         }
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"L1 triage webhook error: {e}")
+        logger.error("l1_webhook_error", extra={"error": str(e)})
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/v1/admin-validator")
-async def admin_validator_webhook(request: Request):
+@app.post("/api/v1/admin-validator", status_code=202)
+async def admin_validator_webhook(request: Request, background: BackgroundTasks):
     """
     Admin Validator - Field requests
     """
-    _ = await request.body()
+    body = await _read_body(request)
 
     if not verify_header_secret(request):
         raise HTTPException(status_code=401, detail="Invalid webhook secret")
 
     try:
-        data = await request.json()
+        data = _parse_json(body)
         issue = data.get("issue", {})
         issue_key = issue.get("key")
         if not issue_key:
             raise HTTPException(status_code=400, detail="No issue key provided")
 
-        logger.info(f"Admin validator webhook received for {issue_key}")
-        result = handle_admin_validator(data, config)
+        logger.info("admin_validator_webhook_received", extra={"issue_key": issue_key})
+        status = _enqueue(background, "admin_validator", issue_key, handle_admin_validator, data)
 
         return {
             "received": True,
             "issue_key": issue_key,
-            "result": result,
+            "status": status,
         }
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Admin validator webhook error: {e}")
+        logger.error("admin_validator_webhook_error", extra={"error": str(e)})
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/v1/jira-architect")
-async def jira_architect_webhook(request: Request):
+@app.post("/api/v1/jira-architect", status_code=202)
+async def jira_architect_webhook(request: Request, background: BackgroundTasks):
     """
     Jira Architect - Admin/architecture guidance
     """
-    _ = await request.body()
+    body = await _read_body(request)
 
     if not verify_header_secret(request):
         raise HTTPException(status_code=401, detail="Invalid webhook secret")
 
     try:
-        data = await request.json()
+        data = _parse_json(body)
         issue = data.get("issue", {})
         issue_key = issue.get("key")
         if not issue_key:
             raise HTTPException(status_code=400, detail="No issue key provided")
 
-        logger.info(f"Jira architect webhook received for {issue_key}")
-        result = handle_jira_architect(data, config)
+        logger.info("jira_architect_webhook_received", extra={"issue_key": issue_key})
+        status = _enqueue(background, "jira_architect", issue_key, handle_jira_architect, data)
 
         return {
             "received": True,
             "issue_key": issue_key,
-            "result": result,
+            "status": status,
         }
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Jira architect webhook error: {e}")
+        logger.error("jira_architect_webhook_error", extra={"error": str(e)})
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -128,16 +263,17 @@ async def hygiene_webhook(request: Request):
     if not verify_header_secret(request):
         raise HTTPException(status_code=401, detail="Invalid webhook secret")
 
+    raw = await _read_body(request)
     try:
-        body = await request.json()
-    except Exception:
+        body = orjson.loads(raw) if raw else {}
+    except orjson.JSONDecodeError:
         body = {}
 
     try:
-        result = handle_hygiene(body, config)
-        return JSONResponse(content=result, status_code=200)
+        result = await _offload(handle_hygiene, body, config)
+        return ORJSONResponse(content=result, status_code=200)
     except Exception as e:
-        logger.error(f"Hygiene webhook error: {e}")
+        logger.error("hygiene_webhook_error", extra={"error": str(e)})
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -146,12 +282,11 @@ async def health_check():
     """
     Health check endpoint – validates LLM and Jira connectivity.
     """
-    # LLM
-    ollama_status = test_ollama_connection(config)
-
-    # Jira
-    jira = JiraAPI(config)
-    jira_status = jira.test_connection()
+    # LLM + Jira probes are blocking HTTP calls; run them side by side off-loop
+    ollama_status, jira_status = await asyncio.gather(
+        _offload(test_ollama_connection, config),
+        _offload(app.state.jira.test_connection),
+    )
 
     status = "healthy" if jira_status.get("success") and ollama_status.get("status") == "success" else "degraded"
     return {
@@ -169,5 +304,15 @@ async def health_check():
 # Optional: allow direct `python -m app.main` run
 if __name__ == "__main__":
     import uvicorn
-    logger.info("Starting dev server from app.main __main__")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    logger.info("Starting server from app.main __main__")
+    uvicorn.run(
+        "app.main:app",            # import string so workers > 1 can spawn
+        host="0.0.0.0",
+        port=8000,
+        workers=max(1, config.web_workers),
+        loop="auto",               # uvloop when installed
+        http="auto",               # httptools when installed
+        access_log=False,          # one stdlib log call per request otherwise
+        backlog=4096,
+        limit_concurrency=config.web_limit_concurrency,
+    )
@@ -12,34 +12,34 @@ from llm.agents.admin_validator import process_admin_request
 from workflows.hygiene_engine import HygieneEngine
 
 
-def handle_l1_triage(payload: dict, cfg: Config) -> dict:
+def handle_l1_triage(payload: dict, cfg: Config, *, jira=None, llm=None) -> dict:
     """
     Thin wrapper around your existing L1 triage function.
     """
     issue = payload.get("issue") or {}
     issue_key = issue.get("key")
     logger.info(f"handler:l1_triage key={issue_key}")
-    return process_l1_triage(issue_key, issue, cfg)
+    return process_l1_triage(issue_key, issue, cfg, jira=jira, llm=llm)
 
 
-def handle_admin_validator(payload: dict, cfg: Config) -> dict:
+def handle_admin_validator(payload: dict, cfg: Config, *, jira=None, llm=None) -> dict:
     """
     Thin wrapper around your existing admin validator function.
     """
     issue = payload.get("issue") or {}
     issue_key = issue.get("key")
     logger.info(f"handler:admin_validator key={issue_key}")
-    return process_admin_request(issue_key, issue, cfg)
+    return process_admin_request(issue_key, issue, cfg, jira=jira, llm=llm)
 
 
-def handle_jira_architect(payload: dict, cfg: Config) -> dict:
+def handle_jira_architect(payload: dict, cfg: Config, *, jira=None, llm=None) -> dict:
     """
     Thin wrapper around your Jira architect function.
     """
     issue = payload.get("issue") or {}
     issue_key = issue.get("key")
     logger.info(f"handler:jira_architect key={issue_key}")
-    return process_jira_architect(issue_key, issue, cfg)
+    return process_jira_architect(issue_key, issue, cfg, jira=jira, llm=llm)
 
 
 def handle_hygiene(payload: dict, cfg: Config) -> dict:
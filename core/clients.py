@@ -0,0 +1,37 @@
+# core/clients.py
+"""
+Process-wide shared Config and JiraAPI.
+
+Rules, engines and the web app all need the same settings and the same Jira
+connection; building them once keeps a single HTTP session (and its pooled
+TLS connections) instead of one per rule instance.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+
+from core.config import get_config
+from core.logging import logger
+
+__all__ = ["get_config", "get_jira"]
+
+if TYPE_CHECKING:
+    from tools.jira_api import JiraAPI
+
+
+@lru_cache(maxsize=1)
+def get_jira() -> Optional["JiraAPI"]:
+    """
+    Return the shared JiraAPI, or None when Jira isn't configured (callers then
+    run in dry-run mode).
+    """
+    cfg = get_config()
+    if not (cfg.jira_base_url and cfg.jira_api_token):
+        return None
+    try:
+        from tools.jira_api import JiraAPI
+        return JiraAPI(cfg)
+    except Exception as e:
+        logger.warning(f"get_jira: could not initialise JiraAPI: {e}")
+        return None
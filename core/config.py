@@ -1,4 +1,6 @@
 import os
+from functools import lru_cache
+
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -10,13 +12,39 @@ class Config:
         self.jira_api_token = os.getenv("JIRA_TOKEN", "")
         self.jira_email = os.getenv("JIRA_EMAIL", "")
         
+        # Client-side write throttle (token bucket: sustained writes/sec, burst)
+        self.jira_write_rate = float(os.getenv("JIRA_WRITE_RATE", "10"))
+        self.jira_write_burst = int(os.getenv("JIRA_WRITE_BURST", "20"))
+        # Opt-in: reuse identical JQL search pages for 60s (writes from other
+        # processes are not seen until the entry expires)
+        self.jira_search_cache = os.getenv("JIRA_SEARCH_CACHE", "false").lower() in ("1", "true", "yes")
+
         # Webhook security
         self.webhook_secret = os.getenv("WEBHOOK_SECRET", "")
         
         # AI settings
         self.ollama_url = os.getenv("OLLAMA_URL", "http://127.0.0.1:11434/api/generate")
         self.model = os.getenv("AI_MODEL", "gpt-oss:20b")
+        # How long Ollama keeps the model loaded after a call ("60m", or -1 for forever)
+        self.ollama_keep_alive = os.getenv("OLLAMA_KEEP_ALIVE", "60m")
+        # Opt-in (dev/test): reuse parsed replies for identical prompts (process-local,
+        # 30 min TTL). Off by default so production answers are never replayed.
+        self.enable_response_cache = os.getenv("LLM_RESPONSE_CACHE", "false").lower() in ("1", "true", "yes")
         
+        # Webhook server: threads for blocking Jira/LLM work
+        self.webhook_worker_threads = int(os.getenv("WEBHOOK_WORKER_THREADS", "32"))
+        # Optional: POST each background webhook result here when it finishes
+        self.completion_webhook_url = os.getenv("COMPLETION_WEBHOOK_URL", "")
+        # HMAC key for those callbacks (X-Signature); separate from WEBHOOK_SECRET so
+        # the receiver never holds the key that authenticates calls to us
+        self.completion_webhook_secret = os.getenv("COMPLETION_WEBHOOK_SECRET", "")
+        # Uvicorn worker processes; in-flight redelivery dedup is per process
+        self.web_workers = int(os.getenv("WEB_WORKERS", "1"))
+        self.web_limit_concurrency = int(os.getenv("WEB_LIMIT_CONCURRENCY", "1000"))
+
+        # Scheduled sweeps remember their last run here (incremental JQL)
+        self.sweep_state_path = os.getenv("SWEEP_STATE_PATH", ".sweep_state.json")
+
         # Environment
         self.environment = os.getenv("ENVIRONMENT", "development")
         
@@ -34,4 +62,10 @@ class Config:
             print(f"   WEBHOOK_SECRET: {'✓' if self.webhook_secret else '✗'}")
         else:
             print("✅ All required environment variables loaded!")
-            print(f"🧼 Default hygiene projects: {', '.join(self.HYGIENE_DEFAULT_PROJECTS)}")
\ No newline at end of file
+            print(f"🧼 Default hygiene projects: {', '.join(self.HYGIENE_DEFAULT_PROJECTS)}")
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the shared Config (env is read and validated once per process)."""
+    return Config()
@@ -1,19 +1,93 @@
 # core/logging.py
+import atexit
+import copy
 import logging
+import logging.handlers
+import os
+import queue
 import sys
 
+import orjson
+
 # Create a single global logger
 logger = logging.getLogger("simple_jira_bot")
 
+# LogRecord attributes that aren't caller-supplied `extra=` fields
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+def _extras(record: logging.LogRecord) -> dict:
+    return {k: v for k, v in record.__dict__.items() if k not in _RECORD_ATTRS}
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per line: ts, level, logger, msg, plus any `extra=` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        doc = {
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        doc.update(_extras(record))
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            doc["exc"] = record.exc_text
+        return orjson.dumps(doc, default=str).decode()
+
+
+class TextFormatter(logging.Formatter):
+    """The classic human-readable line, with `extra=` fields appended as key=value."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        extras = _extras(record)
+        if extras:
+            line += " " + " ".join(f"{k}={v}" for k, v in extras.items())
+        return line
+
+
+_EXC_FORMATTER = logging.Formatter()
+
+
+class _SnapshotQueueHandler(logging.handlers.QueueHandler):
+    """
+    Render the message and traceback on the calling thread (later mutation of
+    %-args can't change what is logged, and no frames are kept alive), but keep
+    the traceback in exc_text instead of folding it into msg, so the JSON
+    output still reports it under "exc".
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _EXC_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
 # Avoid duplicate handlers if file reloads
 if not logger.handlers:
     handler = logging.StreamHandler(sys.stdout)
-    formatter = logging.Formatter(
-        "%(asctime)s [%(levelname)s] %(name)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    if os.getenv("LOG_FORMAT", "text").lower() == "json":
+        formatter = JSONFormatter()
+    else:
+        formatter = TextFormatter(
+            "%(asctime)s [%(levelname)s] %(name)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
     handler.setFormatter(formatter)
-    logger.addHandler(handler)
+
+    # Callers snapshot the record and enqueue it; a background thread formats and writes it
+    _queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    logger.addHandler(_SnapshotQueueHandler(_queue))
+    _listener = logging.handlers.QueueListener(_queue, handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
 
 # Default log level (can override in .env later)
-logger.setLevel(logging.INFO)
\ No newline at end of file
+logger.setLevel(logging.INFO)
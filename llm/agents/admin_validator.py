@@ -8,12 +8,24 @@ from llm.provider import LLMProvider
 from tools.jira_api import JiraAPI
 from tools.blast_radius_engine import analyze_blast_radius
 from tools.field_extractor import extract_field_details
+from llm.agents.l1_triage_bot import _clip_for_prompt
 from core.logging import logger
 
 import os
 
 _DEBUG_CTX = str(os.getenv("ADMIN_VALIDATOR_DEBUG_CONTEXTS", "")).strip().lower() in {"1", "true", "yes"}
 
+# Static so the prompt prefix stays byte-identical across calls (Ollama KV reuse)
+SYSTEM_PROMPT = (
+    'Respond with ONLY this JSON format:\n'
+    '{"approved": true, "reason": "explanation", "auto_create": true}\n\n'
+    "Rules:\n"
+    "- approved: true if duplicates_found = 0\n"
+    "- auto_create: true if approved\n"
+    "- reason: brief explanation\n\n"
+    "JSON only. No other text."
+)
+
 def _ctxdbg(msg: str) -> None:
     if _DEBUG_CTX:
         logger.info(f"[CTXDBG] {msg}")
@@ -55,10 +67,11 @@ def _resolve_project_id(jira: JiraAPI, project_key_or_name: str) -> str | None:
     return None
 
 
-def process_admin_request(issue_key: str, issue_data: dict, config) -> dict:
+def process_admin_request(issue_key: str, issue_data: dict, config, *, jira=None, llm=None) -> dict:
     """Validate and potentially execute admin field requests (create or update)"""
     try:
-        jira = JiraAPI(config)
+        if jira is None:
+            jira = JiraAPI(config)
 
         # Extract ticket fields (handles both webhook payload and direct issue dict)
         fields = issue_data.get("fields", issue_data)
@@ -429,7 +442,7 @@ def process_admin_request(issue_key: str, issue_data: dict, config) -> dict:
             f"- Exact duplicates found: {duplicates_found}\n"
             f"- Similar fields found: {similar_found}\n\n"
             f"Request: {summary}\n"
-            f"Details: {description}\n\n"
+            f"Details: {_clip_for_prompt(description)}\n\n"
             f"Should this field be created? Respond with JSON:\n"
             "{\n"
             '  "approved": true/false,\n'
@@ -437,17 +450,9 @@ def process_admin_request(issue_key: str, issue_data: dict, config) -> dict:
             '  "auto_create": true/false\n'
             "}"
         )
-        system_prompt = (
-            'Respond with ONLY this JSON format:\n'
-            '{"approved": true, "reason": "explanation", "auto_create": true}\n\n'
-            "Rules:\n"
-            "- approved: true if duplicates_found = 0\n"
-            "- auto_create: true if approved\n"
-            "- reason: brief explanation\n\n"
-            "JSON only. No other text."
-        )
-
-        ai_result = LLMProvider(config).chat(prompt, system_prompt=system_prompt)
+        if llm is None:
+            llm = LLMProvider(config)
+        ai_result = llm.chat(prompt, system_prompt=SYSTEM_PROMPT)
         if isinstance(ai_result, dict) and not ai_result.get("error"):
             approved = ai_result.get("approved", False)
             reason = ai_result.get("reason", "No reason provided")
@@ -500,7 +505,7 @@ def process_admin_request(issue_key: str, issue_data: dict, config) -> dict:
     except Exception as e:
         logger.exception(f"Admin validator failed for {issue_key}: {e}")
         try:
-            JiraAPI(config).add_comment(issue_key, f"🤖 *Admin Validator* ❌\n\n*Error*: `{e}`")
+            (jira if jira is not None else JiraAPI(config)).add_comment(issue_key, f"🤖 *Admin Validator* ❌\n\n*Error*: `{e}`")
         except Exception:
             pass
         return {"success": False, "error": str(e)}
@@ -2,12 +2,12 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
-from core.config import Config
+from core.config import Config, get_config
 from llm.provider import LLMProvider
 
 class Agent(ABC):
     def __init__(self, config: Optional[Config] = None, llm: Optional[LLMProvider] = None):
-        self.config = config or Config()
+        self.config = config or get_config()
         self.llm = llm or LLMProvider(self.config)
 
     @abstractmethod
@@ -5,15 +5,23 @@ from __future__ import annotations
 from llm.provider import LLMProvider
 from tools.jira_api import JiraAPI
 from core.logging import logger
-from llm.agents.l1_triage_bot import _extract_description, _get_recent_tickets_context
+from llm.agents.l1_triage_bot import _clip_for_prompt, _extract_description, _get_recent_tickets_context
 
 MARKER = "[LLM_ARCHITECT_V1]"
 
+# Static so the prompt prefix stays byte-identical across calls (Ollama KV reuse)
+SYSTEM_PROMPT = (
+    "You are a Jira architect advising another Jira admin. Provide a concise, actionable plan. "
+    "Include configuration steps, workflow/permission impacts, and any risks or tradeoffs. "
+    "If required information is missing, list the exact questions at the end."
+)
 
-def process_ticket(issue_key: str, issue_data: dict, config) -> dict:
+
+def process_ticket(issue_key: str, issue_data: dict, config, *, jira=None, llm=None) -> dict:
     """Jira architecture guidance for the given ticket"""
     try:
-        jira = JiraAPI(config)
+        if jira is None:
+            jira = JiraAPI(config)
         fields = issue_data.get("fields", issue_data)
         summary = fields.get("summary", "")
         description = _extract_description(fields.get("description", ""))
@@ -31,19 +39,15 @@ def process_ticket(issue_key: str, issue_data: dict, config) -> dict:
 
 {summary}
 
-{description}
+{_clip_for_prompt(description)}
 
 {recent_context}
 
 As a Jira architect, how should I approach this request?"""
 
-        system_prompt = (
-            "You are a Jira architect advising another Jira admin. Provide a concise, actionable plan. "
-            "Include configuration steps, workflow/permission impacts, and any risks or tradeoffs. "
-            "If required information is missing, list the exact questions at the end."
-        )
-
-        ai_response = LLMProvider(config).chat(prompt, system_prompt=system_prompt)
+        if llm is None:
+            llm = LLMProvider(config)
+        ai_response = llm.chat(prompt, system_prompt=SYSTEM_PROMPT)
 
         if isinstance(ai_response, dict):
             if "error" in ai_response:
@@ -6,10 +6,25 @@ from llm.provider import LLMProvider
 from tools.jira_api import JiraAPI
 from core.logging import logger
 
-def process_ticket(issue_key: str, issue_data: dict, config) -> dict:
-    """Your exact ChatGPT workflow: 'How do I fix this user's issue?'"""
+# Keep the ticket text well inside num_ctx so the model has room for the answer
+MAX_PROMPT_DESCRIPTION_CHARS = 8_000
+# Recent tickets checked for similarity when building the prompt context
+RECENT_CONTEXT_LIMIT = 5
+
+# Module constant so every call sends a byte-identical prompt prefix (Ollama
+# reuses its KV cache for it); per-ticket text only goes in the user prompt.
+SYSTEM_PROMPT = """You are an expert IT support technician who provides clear, actionable solutions.
+Give step-by-step troubleshooting advice. If you see similar recent tickets, mention if this might be part of a larger issue.
+Keep your response practical and helpful."""
+
+def process_ticket(issue_key: str, issue_data: dict, config, *, jira=None, llm=None) -> dict:
+    """
+    Your exact ChatGPT workflow: 'How do I fix this user's issue?'
+    Pass long-lived `jira` / `llm` clients to reuse them across webhooks.
+    """
     try:
-        jira = JiraAPI(config)
+        if jira is None:
+            jira = JiraAPI(config)
         fields = issue_data.get("fields", issue_data)
         summary = fields.get("summary", "")
         description = _extract_description(fields.get("description", ""))
@@ -22,17 +37,15 @@ def process_ticket(issue_key: str, issue_data: dict, config) -> dict:
 
 {summary}
 
-{description}
+{_clip_for_prompt(description)}
 
 {recent_context}
 
 How do I go about fixing this user's issue?"""
 
-        system_prompt = """You are an expert IT support technician who provides clear, actionable solutions.
-Give step-by-step troubleshooting advice. If you see similar recent tickets, mention if this might be part of a larger issue.
-Keep your response practical and helpful."""
-
-        ai_response = LLMProvider(config).chat(prompt, system_prompt=system_prompt)
+        if llm is None:
+            llm = LLMProvider(config)
+        ai_response = llm.chat(prompt, system_prompt=SYSTEM_PROMPT)
 
         if isinstance(ai_response, dict):
             if "error" in ai_response:
@@ -59,6 +72,12 @@ Keep your response practical and helpful."""
         logger.error(f"L1 triage failed for {issue_key}: {e}")
         return {"success": False, "error": str(e)}
 
+def _clip_for_prompt(text: str, limit: int = MAX_PROMPT_DESCRIPTION_CHARS) -> str:
+    """Truncate long ticket text before it goes into an LLM prompt"""
+    if len(text) <= limit:
+        return text
+    return text[:limit] + "\n[... truncated]"
+
 def _extract_description(desc_obj):
     """Extract description from either string or ADF format"""
     if not desc_obj:
@@ -79,11 +98,12 @@ def _get_recent_tickets_context(jira, summary, description):
     """Find recent similar tickets for AI context"""
     try:
         jql = "created >= -2h OR updated >= -2h ORDER BY created DESC"
-        search_result = jira.search_issues(jql, max_results=10)
+        # Only the first few summaries are compared; skip the default field set
+        search_result = jira.search_issues(jql, max_results=RECENT_CONTEXT_LIMIT, fields=["summary"])
         if "error" in search_result or not search_result.get("issues"):
             return ""
         context_lines = ["\nRecent similar tickets for context:"]
-        for issue in search_result["issues"][:5]:
+        for issue in search_result["issues"][:RECENT_CONTEXT_LIMIT]:
             recent_summary = issue.get("fields", {}).get("summary", "")
             recent_key = issue.get("key", "")
             if _has_similar_keywords(summary + " " + description, recent_summary):
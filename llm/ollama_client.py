@@ -4,20 +4,59 @@ Migrated from monolithic script with error handling improvements
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import hashlib
 import json
+import orjson
 import time
 import re
 from typing import Dict, Any
 
 from core.config import Config
+from tools.base import TTLCache
 
 import logging
 logger = logging.getLogger(__name__)
 
+# One keep-alive connection pool for every Ollama call (webhooks and sweeps run
+# many calls back to back; no retries here, a failed call takes the fallback path)
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+# Bodies are serialized with orjson and sent as bytes (requests' json= uses stdlib json)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Parsed replies for identical (model, system prompt, prompt) requests. Values are
+# stored as JSON bytes so every hit hands the caller its own fresh dict.
+RESPONSE_CACHE_MAX = 512
+RESPONSE_CACHE_TTL_SEC = 1800
+_RESP_CACHE = TTLCache(maxsize=RESPONSE_CACHE_MAX, ttl=RESPONSE_CACHE_TTL_SEC)
+
+
+def _cache_key(model: str, system_prompt: str, prompt: str) -> bytes:
+    return hashlib.sha256(f"{model}\x00{system_prompt}\x00{prompt}".encode()).digest()
+
+
+def _keep_alive(config: Config) -> int | str:
+    """OLLAMA_KEEP_ALIVE as Ollama expects it: a duration ("60m") or seconds (-1 = forever)."""
+    value = (getattr(config, "ollama_keep_alive", "") or "60m").strip()
+    return int(value) if value.lstrip("-").isdigit() else value
+
+
 def call_ollama(prompt: str, system_prompt: str, config: Config) -> Dict:
     """Call local Ollama with improved timeout and fallback"""
+    use_cache = getattr(config, "enable_response_cache", False)
+    if use_cache:
+        cache_key = _cache_key(config.model, system_prompt, prompt)
+        cached = _RESP_CACHE.get(cache_key)
+        if cached is not None:
+            logger.debug("Ollama response cache hit")
+            return orjson.loads(cached)
+
     try:
-        # Build full prompt
+        # Build full prompt. The system prompt leads so consecutive calls share a
+        # byte-identical prefix that Ollama can serve from its KV cache.
         full_prompt = f"{system_prompt}\n\nAnalyze this request and return ONLY valid JSON:\n{prompt}"
         
         logger.info(f"Calling Ollama model: {config.model}")
@@ -28,6 +67,8 @@ def call_ollama(prompt: str, system_prompt: str, config: Config) -> Dict:
             "model": config.model,
             "prompt": full_prompt,
             "stream": False,
+            # Keep the model (and its prompt-prefix KV cache) loaded between calls
+            "keep_alive": _keep_alive(config),
             "options": {
                 "temperature": 0.1,
                 "top_p": 0.9,
@@ -40,11 +81,13 @@ def call_ollama(prompt: str, system_prompt: str, config: Config) -> Dict:
         
         # Call Ollama with timeout
         start_time = time.time()
-        response = requests.post(config.ollama_url, json=payload, timeout=60)
+        response = _SESSION.post(
+            config.ollama_url, data=orjson.dumps(payload), headers=_JSON_HEADERS, timeout=60
+        )
         elapsed = time.time() - start_time
         
         response.raise_for_status()
-        result = response.json()
+        result = orjson.loads(response.content)
         text = result.get("response", "").strip()
         
         logger.info(f"Ollama responded in {elapsed:.1f}s with {len(text)} characters")
@@ -59,7 +102,7 @@ def call_ollama(prompt: str, system_prompt: str, config: Config) -> Dict:
         
         # Parse JSON with validation
         try:
-            parsed = json.loads(cleaned_text)
+            parsed = orjson.loads(cleaned_text)
             
             # Validate structure for admin requests
             if "field" in prompt.lower() or "admin" in prompt.lower():
@@ -71,9 +114,12 @@ def call_ollama(prompt: str, system_prompt: str, config: Config) -> Dict:
                     logger.warning("Missing admin decision fields in response")
                     return _get_structured_fallback(prompt, "missing_fields")
             
+            # Only real model answers are cached; fallbacks are retried next time
+            if use_cache:
+                _RESP_CACHE.set(cache_key, orjson.dumps(parsed))
             return parsed
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Invalid JSON from AI: {e}")
             logger.debug(f"Raw response: {cleaned_text[:500]}")
             return _get_structured_fallback(prompt, "invalid_json", cleaned_text)
@@ -90,120 +136,154 @@ def call_ollama(prompt: str, system_prompt: str, config: Config) -> Dict:
         logger.error(f"AI call failed: {e}")
         return _get_structured_fallback(prompt, "error", str(e))
 
+
+call_ollama.cache_clear = _RESP_CACHE.clear  # type: ignore[attr-defined]
+
+# Fenced block anywhere in the reply; the closing fence may be missing when the
+# "```" stop sequence cut generation short, in which case find('{') still works.
+_FENCE_RE = re.compile(r"```(?:json|JSON)?\s*\n?(.*?)```", re.S)
+_DECODER = json.JSONDecoder()
+
+_RESPONSE_PREFIXES = (
+    "here's the json response:",
+    "here is the json:",
+    "json response:",
+    "response:",
+    "here's what i found:",
+    "based on the request:",
+)
+
+
 def _clean_response_text(text: str) -> str:
     """Clean up AI response text to extract valid JSON"""
+    # Fast path: most replies are already a bare JSON object, so skip the fence
+    # and prefix handling when one decodes straight from the start.
+    text = text.strip()
+    if text.startswith("{"):
+        try:
+            _, end = _DECODER.raw_decode(text)
+            return text[:end]
+        except json.JSONDecodeError:
+            pass
+
     # Strip code fences if model added them
-    if text.startswith("```"):
-        lines = text.split('\n')
-        if len(lines) > 1:
-            # Remove first line (```json or ```)
-            text = '\n'.join(lines[1:])
-    
-    if text.endswith("```"):
-        lines = text.split('\n')
-        if len(lines) > 1:
-            # Remove last line (```)
-            text = '\n'.join(lines[:-1])
-    
+    m = _FENCE_RE.search(text)
+    if m:
+        text = m.group(1)
+    text = text.strip()
+
     # Remove common prefixes that models add
-    prefixes_to_remove = [
-        "Here's the JSON response:",
-        "Here is the JSON:",
-        "JSON response:",
-        "Response:",
-        "Here's what I found:",
-        "Based on the request:",
-    ]
-    
-    for prefix in prefixes_to_remove:
-        if text.lower().startswith(prefix.lower()):
+    for prefix in _RESPONSE_PREFIXES:
+        if text.lower().startswith(prefix):
             text = text[len(prefix):].strip()
-    
-    # Find JSON object if response has extra text
-    text = text.strip()
-    if not text.startswith('{'):
-        start = text.find('{')
-        if start != -1:
-            text = text[start:]
-    
-    # Find end of JSON object (balance braces)
-    if text.startswith('{'):
-        brace_count = 0
-        for i, char in enumerate(text):
-            if char == '{':
-                brace_count += 1
-            elif char == '}':
-                brace_count -= 1
-                if brace_count == 0:
-                    text = text[:i+1]
-                    break
-    
-    return text.strip()
 
-def _get_structured_fallback(prompt: str, error_type: str, details: str = "") -> Dict:
-    """Generate a structured fallback response when AI fails"""
-    
-    prompt_lower = prompt.lower()
-    
-    # Admin validation fallback with proper structure
-    if any(word in prompt_lower for word in ["field", "custom", "admin", "create", "configuration"]):
-        return {
-            "understanding": f"AI service temporarily unavailable ({error_type}). Admin request detected for manual review.",
-            "plan": [
-                {
-                    "step": 1,
-                    "description": "Manual review required - AI service unavailable",
-                    "api_call": {
-                        "method": "POST",
-                        "endpoint": "/rest/api/3/issue/{issueKey}/comment",
-                        "payload": {
-                            "body": {
-                                "type": "doc",
-                                "version": 1,
-                                "content": [
-                                    {
-                                        "type": "paragraph",
-                                        "content": [
-                                            {
-                                                "type": "text",
-                                                "text": f"AI validation temporarily unavailable ({error_type}). This admin request requires manual review."
-                                            }
-                                        ]
-                                    }
-                                ]
-                            }
+    # First JSON object in the text; raw_decode scans it in C and reports where
+    # it ends, so trailing prose/braces are dropped without a Python-level loop.
+    start = text.find("{")
+    if start == -1:
+        return text
+    try:
+        _, end = _DECODER.raw_decode(text, start)
+    except json.JSONDecodeError:
+        # Not valid JSON from the first brace; let the caller's parse fail into its fallback
+        return text[start:].strip()
+    return text[start:end]
+
+# Keyword -> fallback bucket. Prompts are tokenized once and looked up here
+# instead of scanning the whole prompt once per keyword list.
+_WORD_RE = re.compile(r"[a-z]+")
+_KEYWORD_BUCKETS = {
+    **dict.fromkeys(
+        ("field", "fields", "custom", "admin", "create", "created", "configuration"), "admin"
+    ),
+    **dict.fromkeys(
+        ("enhance", "enhancement", "improve", "meeting", "notes", "story", "stories"), "pm"
+    ),
+    **dict.fromkeys(
+        ("governance", "violation", "violations", "cleanup", "standard", "standards"), "governance"
+    ),
+}
+# When a prompt hits several buckets the earlier one wins (admin > pm > governance)
+_BUCKET_RANK = {"admin": 0, "pm": 1, "governance": 2}
+
+
+def _classify_prompt(prompt: str) -> str | None:
+    """Return the fallback bucket for a prompt, or None for the generic fallback"""
+    best = None
+    for tok in _WORD_RE.findall(prompt.lower()):
+        bucket = _KEYWORD_BUCKETS.get(tok)
+        if bucket is None:
+            continue
+        if bucket == "admin":
+            return bucket
+        if best is None or _BUCKET_RANK[bucket] < _BUCKET_RANK[best]:
+            best = bucket
+    return best
+
+
+def _admin_fallback(error_type: str, details: str) -> Dict:
+    """Admin validation fallback with proper structure"""
+    return {
+        "understanding": f"AI service temporarily unavailable ({error_type}). Admin request detected for manual review.",
+        "plan": [
+            {
+                "step": 1,
+                "description": "Manual review required - AI service unavailable",
+                "api_call": {
+                    "method": "POST",
+                    "endpoint": "/rest/api/3/issue/{issueKey}/comment",
+                    "payload": {
+                        "body": {
+                            "type": "doc",
+                            "version": 1,
+                            "content": [
+                                {
+                                    "type": "paragraph",
+                                    "content": [
+                                        {
+                                            "type": "text",
+                                            "text": f"AI validation temporarily unavailable ({error_type}). This admin request requires manual review."
+                                        }
+                                    ]
+                                }
+                            ]
                         }
                     }
                 }
-            ],
-            "safety_checks": [
-                f"AI validation service error: {error_type}",
-                "Manual review required for this admin request"
-            ],
-            "expected_outcome": "Comment posted requesting manual review",
-            "fallback_reason": error_type
-        }
-    
-    # PM enhancement fallback
-    elif any(word in prompt_lower for word in ["enhance", "improve", "meeting", "notes", "story"]):
-        return {
-            "new_summary": "AI Enhancement Pending",
-            "new_description": f"This ticket is queued for AI enhancement but the service is temporarily unavailable ({error_type}). Manual review recommended.",
-            "comment": f"AI enhancement temporarily unavailable ({error_type}). Ticket marked for manual review.",
-            "marker": f"<!--pm-ai-fallback-{error_type}-->",
-            "fallback_reason": error_type
-        }
-    
-    # Governance bot fallback
-    elif any(word in prompt_lower for word in ["governance", "violation", "cleanup", "standard"]):
-        return {
-            "actions": [],
-            "summary": f"Governance analysis temporarily unavailable ({error_type}). Manual review recommended.",
-            "marker": f"<!--governance-bot-fallback-{error_type}-->",
-            "fallback_reason": error_type
-        }
-    
-    # Generic fallback
+            }
+        ],
+        "safety_checks": [
+            f"AI validation service error: {error_type}",
+            "Manual review required for this admin request"
+        ],
+        "expected_outcome": "Comment posted requesting manual review",
+        "fallback_reason": error_type
+    }
+
+
+def _pm_fallback(error_type: str, details: str) -> Dict:
+    """PM enhancement fallback"""
+    return {
+        "new_summary": "AI Enhancement Pending",
+        "new_description": f"This ticket is queued for AI enhancement but the service is temporarily unavailable ({error_type}). Manual review recommended.",
+        "comment": f"AI enhancement temporarily unavailable ({error_type}). Ticket marked for manual review.",
+        "marker": f"<!--pm-ai-fallback-{error_type}-->",
+        "fallback_reason": error_type
+    }
+
+
+def _governance_fallback(error_type: str, details: str) -> Dict:
+    """Governance bot fallback"""
+    return {
+        "actions": [],
+        "summary": f"Governance analysis temporarily unavailable ({error_type}). Manual review recommended.",
+        "marker": f"<!--governance-bot-fallback-{error_type}-->",
+        "fallback_reason": error_type
+    }
+
+
+def _generic_fallback(error_type: str, details: str) -> Dict:
+    """Generic fallback"""
     return {
         "error": f"AI service temporarily unavailable ({error_type})",
         "details": details,
@@ -212,6 +292,19 @@ def _get_structured_fallback(prompt: str, error_type: str, details: str = "") ->
         "fallback_reason": error_type
     }
 
+
+_FALLBACK_BUILDERS = {
+    "admin": _admin_fallback,
+    "pm": _pm_fallback,
+    "governance": _governance_fallback,
+}
+
+
+def _get_structured_fallback(prompt: str, error_type: str, details: str = "") -> Dict:
+    """Generate a structured fallback response when AI fails"""
+    builder = _FALLBACK_BUILDERS.get(_classify_prompt(prompt), _generic_fallback)
+    return builder(error_type, details)
+
 def test_ollama_connection(config: Config) -> Dict:
     """Test Ollama connection and performance"""
     try:
@@ -222,22 +315,25 @@ def test_ollama_connection(config: Config) -> Dict:
             "model": config.model,
             "prompt": "Return this exact JSON: {\"status\": \"OK\", \"test\": true}",
             "stream": False,
+            "keep_alive": _keep_alive(config),
             "options": {
                 "num_predict": 50,
                 "temperature": 0.1
             }
         }
         
-        response = requests.post(config.ollama_url, json=test_payload, timeout=30)
+        response = _SESSION.post(
+            config.ollama_url, data=orjson.dumps(test_payload), headers=_JSON_HEADERS, timeout=30
+        )
         elapsed = time.time() - start_time
         
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             response_text = result.get("response", "")
             
             # Try to parse the JSON response
             try:
-                parsed_response = json.loads(_clean_response_text(response_text))
+                parsed_response = orjson.loads(_clean_response_text(response_text))
                 json_valid = isinstance(parsed_response, dict) and parsed_response.get("status") == "OK"
             except:
                 json_valid = False
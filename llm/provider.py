@@ -1,7 +1,7 @@
 # llm/provider.py
 from __future__ import annotations
 from typing import Any, Optional
-from core.config import Config
+from core.config import Config, get_config
 from core.logging import logger
 
 # IMPORT PROVIDER CLIENT
@@ -13,7 +13,7 @@ class LLMProvider:
     Default backend is Ollama via llm.ollama_client.call_ollama.
     """
     def __init__(self, config: Optional[Config] = None, backend: str = "ollama"):
-        self.config = config or Config()
+        self.config = config or get_config()
         self.backend = backend
 
     def chat(self, prompt: str, *, system_prompt: str | None = None, **kwargs: Any) -> Any:
@@ -1,12 +1,17 @@
 # llm/runtime.py
 from __future__ import annotations
-import os, json, re
-from typing import Any, Dict
+import os, re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+import orjson
 import yaml
 from core.logging import logger
 
 PROMPTS_DIR = os.path.join(os.path.dirname(__file__), "prompts")
 _VAR = re.compile(r"{{\s*([a-zA-Z0-9_\.]+)\s*}}")
+# Sorted keys keep rendered prompts byte-stable for the same data (LLM response
+# and prefix caches); non-str keys/values are stringified instead of raising.
+_JSON_OPTS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
 
 def load_prompt(name: str) -> Dict[str, Any]:
     """
@@ -18,20 +23,40 @@ def load_prompt(name: str) -> Dict[str, Any]:
     logger.info(f"Loaded prompt: {name}")
     return data
 
+@lru_cache(maxsize=256)
+def _compile(template: str) -> Tuple[Tuple[str, Optional[Tuple[str, ...]]], ...]:
+    """
+    Split a template once into (literal, None) and ("", dotted-path) parts so
+    repeated renders of the same prompt skip the regex scan.
+    """
+    parts: List[Tuple[str, Optional[Tuple[str, ...]]]] = []
+    pos = 0
+    for m in _VAR.finditer(template):
+        if m.start() > pos:
+            parts.append((template[pos:m.start()], None))
+        parts.append(("", tuple(m.group(1).split("."))))
+        pos = m.end()
+    if pos < len(template):
+        parts.append((template[pos:], None))
+    return tuple(parts)
+
+def _lookup(path: Tuple[str, ...], data: Dict[str, Any]) -> str:
+    cur: Any = data
+    for part in path:
+        if isinstance(cur, dict):
+            cur = cur.get(part)
+        else:
+            cur = getattr(cur, part, None)
+    if isinstance(cur, (dict, list)):
+        return orjson.dumps(cur, option=_JSON_OPTS, default=str).decode()
+    return "" if cur is None else str(cur)
+
 def render(template: str, ctx: Dict[str, Any]) -> str:
     """
     Replace {{ var }} with values from ctx; supports dotted keys.
     Dicts/lists are JSON-stringified.
     """
-    def _lookup(path: str, data: Dict[str, Any]) -> Any:
-        cur: Any = data
-        for part in path.split("."):
-            if isinstance(cur, dict):
-                cur = cur.get(part)
-            else:
-                cur = getattr(cur, part, None)
-        if isinstance(cur, (dict, list)):
-            return json.dumps(cur)
-        return "" if cur is None else str(cur)
-
-    return _VAR.sub(lambda m: _lookup(m.group(1), ctx), template or "")
\ No newline at end of file
+    return "".join(
+        literal if path is None else _lookup(path, ctx)
+        for literal, path in _compile(template or "")
+    )
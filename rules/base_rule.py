@@ -7,17 +7,63 @@ Each rule defines:
 """
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from itertools import islice
+from time import sleep
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional
+from core.clients import get_jira
 from core.logging import logger
 
+# JQL string literals: escape backslashes and double quotes in one C-level pass
+_JQL_ESCAPE = str.maketrans({'"': '\\"', "\\": "\\\\"})
+
+
+def jql_quote(value: str) -> str:
+    """Return value as a double-quoted JQL string literal."""
+    return f'"{value.translate(_JQL_ESCAPE)}"'
+
+
+def _write_ok(resp: Any) -> bool:
+    """JiraAPI writes report failure as {"error": ...} rather than raising."""
+    return not (isinstance(resp, dict) and "error" in resp)
+
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of at most `size` items."""
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
 class BaseRule(ABC):
     """Abstract base class that all hygiene rules inherit from."""
 
+    # Keys per bulk write request (and per write_delay pause)
+    WRITE_BATCH_SIZE = 50
+
+    # Lower-case eventType values the rule can react to. HygieneEngine only
+    # calls should_run() for these; None means every event is a candidate.
+    handled_events: Optional[FrozenSet[str]] = None
+
+    # Incremental sweeps: only issues updated since this JQL date/offset (e.g. "-6m")
+    since: Optional[str] = None
+
     def __init__(self, name: str, enabled: bool = True):
-        self.name = name
+        self.name = sys.intern(name)  # rule names are compared/keyed constantly
         self.enabled = enabled
 
+    @cached_property
+    def jira(self) -> Any:
+        """
+        Shared Jira client (real mode), or None → dry-run. Resolved on first
+        use, so rules that are disabled or never fire don't touch it; assign
+        `rule.jira = ...` to inject a client.
+        """
+        return get_jira()
+
     @abstractmethod
     def should_run(self, webhook_data: Dict[str, Any]) -> bool:
         """Return True if the rule should run for this webhook or scheduled event."""
@@ -28,10 +74,165 @@ class BaseRule(ABC):
         """Run the rule logic. Must return a dictionary of results."""
         raise NotImplementedError
 
+    def _since_clause(self) -> str:
+        """' AND updated >= "<since>"' for incremental sweeps, else ''."""
+        return f" AND updated >= {jql_quote(self.since)}" if self.since else ""
+
+    def _iter_search(
+        self,
+        jql: str,
+        fields: List[str],
+        *,
+        batch_size: int,
+        max_results: int,
+        concurrency: int = 1,
+        strict: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield raw issues matching `jql` (up to max_results) in Jira's order,
+        page by page, so callers can process them without holding the full list.
+        If the first page carries a `next_page_token` (cursor endpoint), pages
+        are followed by token. Otherwise, when it reports `total`, the remaining
+        offsets are fetched `concurrency` at a time instead of one RTT after
+        another; failing both, offsets are walked sequentially.
+        strict=True raises RuntimeError on an error/unexpected page; otherwise
+        the search stops there.
+        """
+        jira = self.jira  # type: ignore[attr-defined]
+
+        def fetch(start_at: int, limit: int, token: Optional[str] = None) -> Optional[Dict[str, Any]]:
+            if token:
+                resp = jira.search_issues(jql, max_results=limit, fields=fields, next_page_token=token)
+            else:
+                resp = jira.search_issues(jql, start_at=start_at, max_results=limit, fields=fields)
+            if isinstance(resp, dict) and "issues" in resp and "error" not in resp:
+                return resp
+            if not strict:
+                return None
+            if isinstance(resp, dict) and "error" in resp:
+                raise RuntimeError(resp["error"])
+            raise RuntimeError("Unexpected JiraAPI.search_issues() response shape")
+
+        first = fetch(0, min(batch_size, max_results))
+        issues = (first or {}).get("issues") or []
+        if not issues:
+            return
+        yield from issues
+
+        token = first.get("next_page_token")  # type: ignore[union-attr]
+        if token:
+            # Cursor pagination: each page names the next, so pages are sequential
+            fetched = len(issues)
+            while token and fetched < max_results:
+                resp = fetch(0, min(batch_size, max_results - fetched), token)
+                issues = (resp or {}).get("issues") or []
+                if not issues:
+                    break
+                yield from issues
+                fetched += len(issues)
+                token = resp.get("next_page_token")  # type: ignore[union-attr]
+            return
+
+        total = first.get("total")  # type: ignore[union-attr]
+        if isinstance(total, int):
+            end = min(total, max_results)
+            step = len(issues)  # honour the page size Jira actually returned
+            offsets = list(range(step, end, step))
+            if offsets:
+                workers = max(1, min(concurrency, len(offsets)))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rule-search") as pool:
+                    for resp in pool.map(lambda off: fetch(off, min(step, end - off)), offsets):
+                        if resp is None:
+                            break
+                        yield from resp.get("issues") or []
+            return
+
+        # No total reported: walk pages sequentially
+        start_at = len(issues)
+        remaining = max_results - start_at
+        while remaining > 0:
+            resp = fetch(start_at, min(batch_size, remaining))
+            issues = (resp or {}).get("issues") or []
+            if not issues:
+                break
+            yield from issues
+            start_at += len(issues)
+            remaining -= len(issues)
+
+    def _comment_keys(
+        self,
+        keys: List[str],
+        body_for: Callable[[str], str],
+        delay_sec: float = 0.0,
+        concurrency: int = 1,
+    ) -> int:
+        """
+        Post body_for(key) as a comment on every key. Comments have no bulk
+        endpoint, so each batch of WRITE_BATCH_SIZE keys is fanned out over up
+        to `concurrency` threads, pausing once per batch. Returns the number of
+        comments Jira accepted.
+        """
+        jira = self.jira
+
+        def one(key: str) -> int:
+            try:
+                return int(_write_ok(jira.add_comment(key, body_for(key))))  # type: ignore
+            except Exception:
+                return 0  # keep going; report totals later
+
+        workers = max(1, min(concurrency, len(keys)))
+        written = 0
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rule-write") as pool:
+            for batch in chunked(keys, self.WRITE_BATCH_SIZE):
+                written += sum(pool.map(one, batch))
+                self._pace_writes(delay_sec)
+        return written
+
+    def _label_keys(self, keys: List[str], label: str, delay_sec: float = 0.0) -> int:
+        """
+        Add `label` to every key. Uses one jira.bulk_add_label() call per
+        WRITE_BATCH_SIZE keys when the client has it, falling back to per-issue
+        add_label() for a batch the bulk call rejects. Pauses once per batch.
+        Returns the number of issues labelled. A bulk batch counts once Jira
+        accepts the bulk-edit task; Jira applies it asynchronously, so the
+        labels may not be visible to a search straight away.
+        """
+        jira = getattr(self, "jira", None)
+        bulk = getattr(jira, "bulk_add_label", None)
+        written = 0
+        for batch in chunked(keys, self.WRITE_BATCH_SIZE):
+            resp = None
+            if bulk is not None:
+                try:
+                    resp = bulk(batch, label)
+                except Exception:
+                    resp = None
+            if isinstance(resp, dict) and _write_ok(resp):
+                written += len(batch)
+            else:
+                for k in batch:
+                    try:
+                        if _write_ok(jira.add_label(k, label)):  # type: ignore
+                            written += 1
+                    except Exception:
+                        pass
+            self._pace_writes(delay_sec)
+        return written
+
+    def _pace_writes(self, delay_sec: float) -> None:
+        """
+        Pause between writes with a fixed delay, unless the Jira client
+        rate-limits its own writes (JiraAPI.rate_limiter), in which case
+        writes run at full speed until the bucket says otherwise.
+        """
+        if delay_sec and getattr(getattr(self, "jira", None), "rate_limiter", None) is None:
+            sleep(delay_sec)
+
     def log_result(self, result: Dict[str, Any]) -> None:
         """Basic logging helper for consistent rule output."""
         status = result.get("status", "completed")
-        logger.info(f"[{self.name}] → {status} | details={result}")
+        # %-style args: the (possibly large) result dict is only rendered if emitted
+        logger.info("[%s] → %s | details=%s", self.name, status, result)
 
     def __repr__(self) -> str:
         return f"<Rule name={self.name} enabled={self.enabled}>"
\ No newline at end of file
@@ -1,19 +1,27 @@
 # rules/duplicate_check.py
 from __future__ import annotations
+import hashlib
+import re
 from typing import Any, Dict, List, Optional
-from time import sleep
 
 from rules.base_rule import BaseRule
+from tools.base import TTLCache
 
-# Soft imports so local dev works without Jira creds
-try:
-    from core.config import Config
-    from tools.jira_api import JiraAPI as _JiraAPI
-    _HAS_JIRA = True
-except Exception:
-    _HAS_JIRA = False
-    _JiraAPI = None  # type: ignore
-    Config = None    # type: ignore
+
+# Significant words (letters/digits, 3+ chars). Quotes, backslashes, ~, *, ? etc.
+# never reach the JQL, so summaries can't break or widen the text search.
+_SEARCH_TERM = re.compile(r"[^\W_]{3,}")
+_MAX_SEARCH_TERMS = 6
+
+# issue key -> fingerprint of the last JQL searched for it. issue_updated events
+# that don't touch the summary (status, assignee, ...) rebuild the same JQL and
+# skip the search; entries expire so new look-alikes are still picked up.
+_SEEN_TTL_SEC = 3600
+_SEEN = TTLCache(maxsize=100_000, ttl=_SEEN_TTL_SEC)
+
+
+def _fingerprint(jql: str) -> bytes:
+    return hashlib.blake2b(jql.encode("utf-8"), digest_size=8).digest()
 
 
 class DuplicateCheckRule(BaseRule):
@@ -22,6 +30,9 @@ class DuplicateCheckRule(BaseRule):
     Triggered on issue_created / issue_updated (or can be called in a sweep with issue context).
     """
 
+    # eventType values this rule reacts to (see BaseRule.handled_events)
+    handled_events = frozenset({"issue_created", "issue_updated"})
+
     def __init__(
         self,
         lookback_days: int = 14,
@@ -40,14 +51,9 @@ class DuplicateCheckRule(BaseRule):
         self.max_results = max(1, max_results)
         self.write_delay_sec = max(0.0, write_delay_sec)
 
-        self.jira = None
-        if _HAS_JIRA:
-            try:
-                cfg = Config()
-                if cfg.jira_base_url and cfg.jira_api_token:
-                    self.jira = _JiraAPI(cfg)
-            except Exception:
-                self.jira = None
+        # Only the search terms and the current key vary per event
+        self._jql_prefix = self._project_clause()
+        self._jql_suffix = f"AND created >= -{self.lookback_days}d ORDER BY created DESC"
 
     # ------------ rule contract ------------
 
@@ -55,7 +61,7 @@ class DuplicateCheckRule(BaseRule):
         if not self.enabled:
             return False
         event = (data or {}).get("eventType", "").lower()
-        return event in {"issue_created", "issue_updated"}
+        return event in self.handled_events
 
     def execute(self, data: Dict[str, Any]) -> Dict[str, Any]:
         if not self.enabled:
@@ -75,6 +81,17 @@ class DuplicateCheckRule(BaseRule):
             return res
 
         jql = self._build_jql(summary, key)
+        if not jql:
+            res = {"rule": self.name, "status": "skipped", "issue_key": key, "reason": "no_search_terms"}
+            self.log_result(res)
+            return res
+
+        fp = _fingerprint(jql)
+        event = (data or {}).get("eventType", "").lower()
+        if event == "issue_updated" and _SEEN.get(key) == fp:
+            res = {"rule": self.name, "status": "skipped", "issue_key": key, "reason": "unchanged"}
+            self.log_result(res)
+            return res
 
         # Dry-run
         if self.jira is None:
@@ -94,6 +111,8 @@ class DuplicateCheckRule(BaseRule):
         try:
             resp = self.jira.search_issues(jql, max_results=self.max_results, fields=["summary"])  # type: ignore
             issues = resp.get("issues", []) if isinstance(resp, dict) else []
+            if isinstance(resp, dict) and "error" not in resp:
+                _SEEN.set(key, fp)
             dupes = [
                 {"key": it.get("key"), "summary": (it.get("fields") or {}).get("summary", "")}
                 for it in issues if it.get("key")
@@ -105,8 +124,7 @@ class DuplicateCheckRule(BaseRule):
                 try:
                     self.jira.add_comment(key, comment)  # type: ignore
                     actions["comments"] = 1
-                    if self.write_delay_sec:
-                        sleep(self.write_delay_sec)
+                    self._pace_writes(self.write_delay_sec)
                 except Exception:
                     pass
 
@@ -136,19 +154,22 @@ class DuplicateCheckRule(BaseRule):
 
     def _build_jql(self, summary: str, current_key: str) -> str:
         """
-        Simple text match on the summary over recent issues, excluding the current one.
-        You can swap to 'text ~ ""' if you want description matching too.
+        Text match on the summary's significant words over recent issues, excluding
+        the current one. Returns "" when the summary has nothing worth searching for.
         """
-        # Escape quotes in summary for JQL
-        safe_summary = summary.replace('"', '\\"')
-        base = (
-            f"{self._project_clause()}"
-            f'text ~ "{safe_summary}" '
-            f"AND key != {current_key} "
-            f"AND created >= -{self.lookback_days}d "
-            f"ORDER BY created DESC"
-        )
-        return base
+        terms: List[str] = []
+        seen = set()
+        for word in _SEARCH_TERM.findall(summary):
+            folded = word.casefold()
+            if folded not in seen:
+                seen.add(folded)
+                terms.append(word)
+                if len(terms) == _MAX_SEARCH_TERMS:
+                    break
+        if not terms:
+            return ""
+
+        return f'{self._jql_prefix}text ~ "{" ".join(terms)}" AND key != {current_key} {self._jql_suffix}'
 
     def _build_comment(self, dupes: List[Dict[str, str]]) -> str:
         lines = [self.comment_prefix, ""]
@@ -9,8 +9,9 @@ Features:
 - Dry-run if Jira isn't configured (no crashes during local dev)
 - Project scoping
 - Optional status scoping (e.g., only run for "In Progress", "Ready for Dev")
-- Pagination (batches of 100)
-- Optional side effects: add a comment and/or a label
+- Pagination (batches of 100; pages after the first are fetched concurrently)
+- Optional side effects: add comment and/or label (comments posted concurrently,
+  labels in bulk batches)
 - Clear, stable result payload
 
 Notes:
@@ -20,24 +21,13 @@ Notes:
 """
 
 from typing import Any, Dict, List, Optional
-from time import sleep
-from rules.base_rule import BaseRule
-
-# Soft imports to keep dev smooth without creds
-try:
-    from core.config import Config
-    try:
-        from tools.jira_api import JiraAPI as _JiraAPI
-    except Exception:
-        from tools.jira_api import JiraAPI as _JiraAPI  # fallback
-    _HAS_JIRA = True
-except Exception:
-    _HAS_JIRA = False
-    _JiraAPI = None
-    Config = None  # type: ignore
+from rules.base_rule import BaseRule, jql_quote
 
 
 class MissingFieldsRule(BaseRule):
+    # eventType values this rule reacts to (see BaseRule.handled_events)
+    handled_events = frozenset({"issue_created", "issue_updated", "scheduled_sweep"})
+
     def __init__(
         self,
         required: List[str],
@@ -51,6 +41,9 @@ class MissingFieldsRule(BaseRule):
         max_results: int = 1000,
         batch_size: int = 100,
         write_delay_sec: float = 0.2,
+        write_concurrency: int = 8,
+        fetch_concurrency: int = 4,
+        since: Optional[str] = None,
     ):
         super().__init__(name="MissingFieldsRule", enabled=enabled)
         if not required:
@@ -59,7 +52,7 @@ class MissingFieldsRule(BaseRule):
         self.required = [s.strip() for s in required if s and s.strip()]
         self.projects = projects or []
         self.statuses = [s.strip() for s in statuses or []]
-        self.exclude_statuses = set((exclude_statuses or []))
+        self.exclude_statuses = frozenset(exclude_statuses or ())
 
         self.add_comment = bool(add_comment)
         self.comment_text = comment_text or (
@@ -69,17 +62,17 @@ class MissingFieldsRule(BaseRule):
 
         self.max_results = max(1, max_results)
         self.batch_size = max(1, min(batch_size, 100))
-        self.write_delay_sec = max(0.0, write_delay_sec)
-
-        # Initialize Jira client (real mode) if possible
-        self.jira = None
-        if _HAS_JIRA:
-            try:
-                self.cfg = Config()
-                if self.cfg.jira_base_url and self.cfg.jira_api_token:
-                    self.jira = _JiraAPI(self.cfg)
-            except Exception:
-                self.jira = None  # stay in dry-run
+        self.write_delay_sec = max(0.0, write_delay_sec)  # fixed pause per write when the client has no rate_limiter
+        self.write_concurrency = max(1, write_concurrency)
+        self.fetch_concurrency = max(1, fetch_concurrency)
+        # Incremental sweeps: only issues updated since this JQL date/offset (e.g. "-1440m")
+        self.since = since
+
+        # Every input to the query is fixed at construction; build the JQL once.
+        # (FieldA is EMPTY OR FieldB is EMPTY ...)
+        parts = [f"{jql_quote(name)} is EMPTY" if " " in name else f"{name} is EMPTY" for name in self.required]
+        self._missing_clause = " AND (" + " OR ".join(parts) + ")"
+        self._jql = self._build_jql()
 
     # ----------------- rule contract -----------------
 
@@ -88,7 +81,7 @@ class MissingFieldsRule(BaseRule):
         if not self.enabled:
             return False
         event = (data or {}).get("eventType", "").lower()
-        return event in {"issue_created", "issue_updated", "scheduled_sweep"}
+        return event in self.handled_events
 
     def execute(self, data: Dict[str, Any]) -> Dict[str, Any]:
         if not self.enabled:
@@ -96,7 +89,7 @@ class MissingFieldsRule(BaseRule):
             self.log_result(res)
             return res
 
-        jql = self._build_jql()
+        jql = self._jql
 
         # Dry run: no Jira client initialised
         if self.jira is None:
@@ -146,17 +139,15 @@ class MissingFieldsRule(BaseRule):
     def _status_clause(self) -> str:
         clause = ""
         if self.statuses:
-            statuses = ",".join(f'"{s}"' for s in self.statuses)
+            statuses = ",".join(map(jql_quote, self.statuses))
             clause += f" AND status in ({statuses})"
         if self.exclude_statuses:
-            ex = ",".join(f'"{s}"' for s in sorted(self.exclude_statuses))
+            ex = ",".join(map(jql_quote, sorted(self.exclude_statuses)))
             clause += f" AND status not in ({ex})"
         return clause
 
     def _missing_fields_clause(self) -> str:
-        # Build (FieldA is EMPTY OR FieldB is EMPTY ...)
-        parts = [f'"{name}" is EMPTY' if " " in name else f"{name} is EMPTY" for name in self.required]
-        return " AND (" + " OR ".join(parts) + ")"
+        return self._missing_clause
 
     def _build_jql(self) -> str:
         # Default to excluding Done category; if you want it configurable, add a flag later
@@ -165,70 +156,33 @@ class MissingFieldsRule(BaseRule):
             f"statusCategory != Done"
             f"{self._status_clause()}"
             f"{self._missing_fields_clause()}"
+            f"{self._since_clause()}"
         )
         return base
 
     def _search_all(self, jql: str) -> List[Dict[str, Any]]:
-        """Paginate through Jira search results using JiraAPI.search_issues."""
-        results: List[Dict[str, Any]] = []
-        start_at = 0
-        remaining = self.max_results
-
-        while remaining > 0:
-            limit = min(self.batch_size, remaining)
-            resp = self.jira.search_issues(  # type: ignore
-                jql, start_at=start_at, max_results=limit, fields=["key"]
-            )
-
-            if isinstance(resp, dict) and "error" in resp:
-                raise RuntimeError(resp["error"])
-            if not isinstance(resp, dict) or "issues" not in resp:
-                raise RuntimeError("Unexpected JiraAPI.search_issues() response shape")
-
-            issues = resp.get("issues", []) or []
-            if not issues:
-                break
-
-            for item in issues:
-                key = item.get("key")
-                if key:
-                    results.append({"key": key})
-
-            got = len(issues)
-            start_at += got
-            remaining -= got
-
-            total = resp.get("total")
-            if isinstance(total, int) and start_at >= total:
-                break
-
-        return results
+        """Paginate through Jira search results (later pages fetched concurrently)."""
+        issues = self._iter_search(
+            jql, ["key"],
+            batch_size=self.batch_size,
+            max_results=self.max_results,
+            concurrency=self.fetch_concurrency,
+        )
+        return [{"key": item["key"]} for item in issues if item.get("key")]
 
     def _maybe_write_actions(self, keys: List[str]) -> Dict[str, int]:
         """Optionally add a comment and/or label; return counts written."""
+        if self.jira is None or not keys or not (self.add_comment or self.add_label):
+            return {"comments": 0, "labels": 0}
+
         written_comments = 0
         written_labels = 0
-        if self.jira is None or not keys:
-            return {"comments": 0, "labels": 0}
+        if self.add_comment:
+            written_comments = self._comment_keys(
+                keys, lambda _k: self.comment_text, self.write_delay_sec, self.write_concurrency
+            )
+
+        if self.add_label:
+            written_labels = self._label_keys(keys, self.add_label, self.write_delay_sec)
 
-        for k in keys:
-            if self.add_comment:
-                try:
-                    self.jira.add_comment(k, self.comment_text)  # type: ignore
-                    written_comments += 1
-                    if self.write_delay_sec:
-                        sleep(self.write_delay_sec)
-                except Exception:
-                    pass
-
-            if self.add_label:
-                try:
-                    # Implement add_label in your JiraAPI if you want this live.
-                    self.jira.add_label(k, self.add_label)  # type: ignore
-                    written_labels += 1
-                    if self.write_delay_sec:
-                        sleep(self.write_delay_sec)
-                except Exception:
-                    pass
-
-        return {"comments": written_comments, "labels": written_labels}
\ No newline at end of file
+        return {"comments": written_comments, "labels": written_labels}
@@ -10,7 +10,7 @@ Features:
 - Dry-run if Jira isn't configured (safe local testing)
 - Project scoping
 - Status scoping (e.g., "In Progress", "Ready for Dev")
-- Pagination (batches of 100)
+- Pagination (batches of 100; pages after the first are fetched concurrently)
 - Optional side effects: add a comment and/or a label
 - Clear, structured results (per issue keys flagged)
 
@@ -19,25 +19,28 @@ Notes:
 - For additional invariants later, extend `_violations_for_issue()`.
 """
 
-from typing import Any, Dict, List, Optional
-from time import sleep
-from rules.base_rule import BaseRule
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from rules.base_rule import BaseRule, jql_quote
 
-# Soft imports to keep dev smooth without creds
-try:
-    from core.config import Config
-    try:
-        from tools.jira_api import JiraAPI as _JiraAPI
-    except Exception:
-        from tools.jira_api import JiraAPI as _JiraAPI  # fallback
-    _HAS_JIRA = True
-except Exception:
-    _HAS_JIRA = False
-    _JiraAPI = None
-    Config = None  # type: ignore
+
+_EMPTY_VALUES = (None, "", [], {})
+
+
+@lru_cache(maxsize=64)
+def _format_comment(violations: Tuple[str, ...]) -> str:
+    # Sweeps repeat the same few violation sets ("Missing assignee", ...);
+    # keyed by the ordered tuple so each distinct comment is built once.
+    base = "⚠️ Workflow validation:"
+    if not violations:
+        return base
+    return base + " " + "; ".join(violations)
 
 
 class WorkflowValidatorRule(BaseRule):
+    # eventType values this rule reacts to (see BaseRule.handled_events)
+    handled_events = frozenset({"issue_created", "issue_updated", "scheduled_sweep"})
+
     def __init__(
         self,
         statuses: List[str],                     # statuses where invariants apply
@@ -57,6 +60,9 @@ class WorkflowValidatorRule(BaseRule):
         max_results: int = 1000,
         batch_size: int = 100,
         write_delay_sec: float = 0.2,
+        fetch_concurrency: int = 4,
+        write_concurrency: int = 8,
+        since: Optional[str] = None,
     ):
         super().__init__(name="WorkflowValidatorRule", enabled=enabled)
 
@@ -77,16 +83,17 @@ class WorkflowValidatorRule(BaseRule):
         self.max_results = max(1, max_results)
         self.batch_size = max(1, min(batch_size, 100))
         self.write_delay_sec = max(0.0, write_delay_sec)
-
-        # Initialize Jira client (real mode) if possible
-        self.jira = None
-        if _HAS_JIRA:
-            try:
-                self.cfg = Config()
-                if self.cfg.jira_base_url and self.cfg.jira_api_token:
-                    self.jira = _JiraAPI(self.cfg)
-            except Exception:
-                self.jira = None  # stay in dry-run
+        self.fetch_concurrency = max(1, fetch_concurrency)
+        self.write_concurrency = max(1, write_concurrency)
+        # Incremental sweeps: only issues updated since this JQL date/offset (e.g. "-1440m")
+        self.since = since
+
+        # Every input to the query is fixed at construction; build the JQL once
+        self._jql = self._build_jql()
+        # require_fields name → field ID, resolved on first real search
+        self._require_ids: Optional[Dict[str, str]] = None
+        # (field ID, message) pairs checked against every issue; filled with _require_ids
+        self._field_checks: List[Tuple[str, str]] = []
 
     # ----------------- rule contract -----------------
 
@@ -94,7 +101,7 @@ class WorkflowValidatorRule(BaseRule):
         if not self.enabled:
             return False
         event = (data or {}).get("eventType", "").lower()
-        return event in {"issue_created", "issue_updated", "scheduled_sweep"}
+        return event in self.handled_events
 
     def execute(self, data: Dict[str, Any]) -> Dict[str, Any]:
         if not self.enabled:
@@ -102,7 +109,7 @@ class WorkflowValidatorRule(BaseRule):
             self.log_result(res)
             return res
 
-        jql = self._build_jql()
+        jql = self._jql
 
         # Dry run
         if self.jira is None:
@@ -121,12 +128,10 @@ class WorkflowValidatorRule(BaseRule):
 
         # Real mode
         try:
-            items = self._search_all(jql)
-            # Build per-issue violation report
+            # Build per-issue violation report as pages stream in; only flagged
+            # issues are kept, not the whole result set
             per_issue_violations: Dict[str, List[str]] = {}
-            for it in items:
-                key = it["key"]
-                fields = it.get("fields", {})
+            for key, fields in self._iter_issues(jql):
                 vios = self._violations_for_issue(fields)
                 if vios:
                     per_issue_violations[key] = vios
@@ -160,7 +165,7 @@ class WorkflowValidatorRule(BaseRule):
         return f"project in ({csv_vals}) AND "
 
     def _status_clause(self) -> str:
-        statuses = ",".join(f'"{s}"' for s in self.statuses)
+        statuses = ",".join(map(jql_quote, self.statuses))
         return f" AND status in ({statuses})"
 
     def _build_jql(self) -> str:
@@ -170,107 +175,82 @@ class WorkflowValidatorRule(BaseRule):
             f"{self._project_clause()}"
             f"statusCategory != Done"
             f"{self._status_clause()}"
+            f"{self._since_clause()}"
         )
         return base
 
-    def _search_all(self, jql: str) -> List[Dict[str, Any]]:
-        """Paginate using JiraAPI.search_issues; fetch required fields."""
-        results: List[Dict[str, Any]] = []
-        start_at = 0
-        remaining = self.max_results
-
-        # Always include 'key' and 'assignee'; include required fields if specified.
-        fields = ["key", "assignee"]
-        # For required_fields, if they contain spaces, Jira accepts quoted names in JQL,
-        # but field retrieval usually needs IDs; many sites still return by name via 'fields' selector.
-        # Keep names for now; you can switch to IDs later if needed.
-        fields.extend(self.require_fields)
-
-        while remaining > 0:
-            limit = min(self.batch_size, remaining)
-            resp = self.jira.search_issues(  # type: ignore
-                jql, start_at=start_at, max_results=limit, fields=fields
-            )
-
-            if isinstance(resp, dict) and "error" in resp:
-                raise RuntimeError(resp["error"])
-            if not isinstance(resp, dict) or "issues" not in resp:
-                raise RuntimeError("Unexpected JiraAPI.search_issues() response shape")
-
-            issues = resp.get("issues", []) or []
-            if not issues:
-                break
-
-            for item in issues:
-                key = item.get("key")
-                f = item.get("fields", {}) or {}
-                if key:
-                    results.append({"key": key, "fields": f})
-
-            got = len(issues)
-            start_at += got
-            remaining -= got
-
-            total = resp.get("total")
-            if isinstance(total, int) and start_at >= total:
-                break
-
-        return results
-
-    def _violations_for_issue(self, fields: Dict[str, Any]) -> List[str]:
-        """Return a list of violation messages for a single issue."""
-        violations: List[str] = []
-
-        # Assignee check
-        if self.require_assignee:
-            assignee = fields.get("assignee")
-            # On Cloud, assignee is an object or None
-            if not assignee:
-                violations.append("Missing assignee")
-
-        # Required fields check (by *name*; may need IDs later)
-        for name in self.require_fields:
-            # Jira field dict keys are field IDs; for common names like "labels", "Story Points", Cloud maps to:
-            # - labels: fields['labels'] (list)
-            # - Story Points: often 'customfield_xxxxx'; some sites alias by name in search results
-            val = fields.get(name)
-            if val in (None, "", [], {}):
-                violations.append(f"Missing field: {name}")
-
-        return violations
+    def _iter_issues(self, jql: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (key, fields) per matching issue; later pages are fetched concurrently."""
+        # Always include 'key' and 'assignee'; include required fields if specified
+        search_fields = ["key", "assignee", *self._required_field_ids().values()]
+        for item in self._iter_search(
+            jql, search_fields,
+            batch_size=self.batch_size,
+            max_results=self.max_results,
+            concurrency=self.fetch_concurrency,
+        ):
+            key = item.get("key")
+            if key:
+                yield key, item.get("fields", {}) or {}
+
+    def _required_field_ids(self) -> Dict[str, str]:
+        """
+        Resolve require_fields to field IDs once via the client's
+        resolve_field_ids() (one cached /field call). Names it can't resolve,
+        or clients without the method, fall back to the name itself.
+        """
+        if self._require_ids is None:
+            resolve = getattr(self.jira, "resolve_field_ids", None)
+            found = resolve(self.require_fields) if (resolve and self.require_fields) else {}
+            self._require_ids = {n: found.get(n, n) for n in self.require_fields}
+            self._field_checks = [(fid, f"Missing field: {n}") for n, fid in self._require_ids.items()]
+        return self._require_ids
+
+    def _violations_for_issue(self, fields: Dict[str, Any]) -> Sequence[str]:
+        """
+        Return the violation messages for a single issue. Compliant issues (the
+        common case) get the shared empty tuple, so no list is allocated for them.
+        """
+        violations: Optional[List[str]] = None
+        get = fields.get
+
+        # Assignee check (on Cloud, assignee is an object or None)
+        if self.require_assignee and not get("assignee"):
+            violations = ["Missing assignee"]
+
+        # Required fields check. Search results are keyed by field ID
+        # (e.g. Story Points → customfield_10016), so look each one up by its ID.
+        if self._require_ids is None:
+            self._required_field_ids()
+        for fid, msg in self._field_checks:
+            if get(fid) in _EMPTY_VALUES:
+                if violations is None:
+                    violations = [msg]
+                else:
+                    violations.append(msg)
+
+        return violations or ()
 
     def _maybe_write_actions(self, keys: List[str], per_issue: Dict[str, List[str]]) -> Dict[str, int]:
         """Optionally add comment and/or label; return counts written."""
         written_comments = 0
         written_labels = 0
-        if self.jira is None or not keys:
+        if self.jira is None or not keys or not (self.add_comment or self.add_label):
             return {"comments": 0, "labels": 0}
 
-        for k in keys:
-            if self.add_comment:
-                try:
-                    msg = self._build_comment(per_issue.get(k, []))
-                    self.jira.add_comment(k, msg)  # type: ignore
-                    written_comments += 1
-                    if self.write_delay_sec:
-                        sleep(self.write_delay_sec)
-                except Exception:
-                    pass
-
-            if self.add_label:
-                try:
-                    # Implement add_label in JiraAPI if you want this live.
-                    self.jira.add_label(k, self.add_label)  # type: ignore
-                    written_labels += 1
-                    if self.write_delay_sec:
-                        sleep(self.write_delay_sec)
-                except Exception:
-                    pass
+        # Comments are per-issue text (memoized per violation set)
+        if self.add_comment:
+            written_comments = self._comment_keys(
+                keys,
+                lambda k: self._build_comment(per_issue.get(k, [])),
+                self.write_delay_sec,
+                self.write_concurrency,
+            )
+
+        if self.add_label:
+            written_labels = self._label_keys(keys, self.add_label, self.write_delay_sec)
 
         return {"comments": written_comments, "labels": written_labels}
 
-    def _build_comment(self, violations: List[str]) -> str:
-        base = "⚠️ Workflow validation:"
-        if not violations:
-            return base
-        return base + " " + "; ".join(violations)
\ No newline at end of file
+    def _build_comment(self, violations: Sequence[str]) -> str:
+        return _format_comment(tuple(violations))
\ No newline at end of file
@@ -9,36 +9,38 @@ Useful for:
 Example:
     uvicorn scripts.run_webhook_dev:app --reload --port 9000
 """
-import json
 import logging
+
+import orjson
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("webhook-dev")
 
-app = FastAPI(title="Webhook Dev Server", version="0.1")
+def _pretty(value) -> str:
+    return orjson.dumps(value, option=orjson.OPT_INDENT_2, default=str).decode()
+
+app = FastAPI(title="Webhook Dev Server", version="0.1", default_response_class=ORJSONResponse)
 
 @app.post("/webhook")
 async def receive_webhook(request: Request):
     """Catch-all endpoint for any POSTed JSON webhook payload."""
-    headers = dict(request.headers)
+    raw = await request.body()
     try:
-        body = await request.json()
-    except Exception:
-        body = await request.body()
-        try:
-            body = body.decode()
-        except Exception:
-            pass
-
-    logger.info("=" * 60)
-    logger.info("📩 Webhook received")
-    logger.info(f"Headers: {json.dumps(headers, indent=2)}")
-    logger.info(f"Body: {json.dumps(body, indent=2) if isinstance(body, (dict, list)) else body}")
-    logger.info("=" * 60)
-
-    return JSONResponse({"ok": True, "message": "Received", "type": type(body).__name__})
+        body = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        body = raw.decode(errors="replace")
+
+    # Pretty-printing is the point of this server, but skip it if INFO is muted
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("=" * 60)
+        logger.info("📩 Webhook received")
+        logger.info(f"Headers: {_pretty(dict(request.headers))}")
+        logger.info(f"Body: {_pretty(body) if isinstance(body, (dict, list)) else body}")
+        logger.info("=" * 60)
+
+    return {"ok": True, "message": "Received", "type": type(body).__name__}
 
 @app.get("/")
 async def root():
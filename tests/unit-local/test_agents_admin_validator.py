@@ -1,13 +1,15 @@
 # tests/unit-local/test_agents_admin_validator.py
 import pytest
+import llm.agents.admin_validator as av
 from llm.agents.admin_validator import process_admin_request  # correct path
 
 
 class FakeJira:
     def __init__(self, dup=0, sim=0, create_ok=True):
         self.comments = []
-        self._dup = dup
-        self._sim = sim
+        # Built once; the validator only len()s them, so immutable tuples are fine
+        self._dups = tuple(range(dup))
+        self._similar = tuple(range(sim))
         self._create_ok = create_ok
 
     def add_comment(self, key, body):
@@ -16,8 +18,8 @@ class FakeJira:
 
     def check_duplicate_field(self, name):
         return {
-            "duplicates": list(range(self._dup)),
-            "similar": list(range(self._sim)),
+            "duplicates": self._dups,
+            "similar": self._similar,
             "total_checked": 10,
         }
 
@@ -31,26 +33,24 @@ class FakeConfig:
     pass
 
 
-@pytest.fixture(autouse=True)
-def patch_jira_and_llm(monkeypatch):
-    import llm.agents.admin_validator as av
+class FLLM:
+    """Default LLM that approves (can be overridden per test)."""
+    def __init__(self, cfg): ...
+    def chat(self, prompt, system_prompt=None):
+        return {"approved": True, "reason": "no duplicates", "auto_create": True}
 
-    # Default Jira fake (can be overridden per test)
-    monkeypatch.setattr(av, "JiraAPI", lambda cfg: FakeJira())
 
-    # Default LLM that approves (can be overridden per test)
-    class FLLM:
-        def __init__(self, cfg): ...
-        def chat(self, prompt, system_prompt=None):
-            return {"approved": True, "reason": "no duplicates", "auto_create": True}
-
-    monkeypatch.setattr(av, "LLMProvider", lambda cfg: FLLM(cfg))
-    yield
+@pytest.fixture(scope="module", autouse=True)
+def patch_jira_and_llm():
+    # Installed once per module; tests that override these use the function-scoped
+    # `monkeypatch`, which is undone before the next test and restores these defaults.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(av, "JiraAPI", lambda cfg: FakeJira())
+        mp.setattr(av, "LLMProvider", lambda cfg: FLLM(cfg))
+        yield
 
 
 def test_admin_validator_happy_path_creates_field(monkeypatch):
-    import llm.agents.admin_validator as av
-
     # Ensure a non-empty field name so we don't hit the needs_info early return
     monkeypatch.setattr(
         av, "extract_field_details",
@@ -73,8 +73,6 @@ def test_admin_validator_happy_path_creates_field(monkeypatch):
 
 
 def test_admin_validator_dup_found_blocks_create(monkeypatch):
-    import llm.agents.admin_validator as av
-
     monkeypatch.setattr(
         av, "extract_field_details",
         lambda summary, description: {
@@ -95,8 +93,6 @@ def test_admin_validator_dup_found_blocks_create(monkeypatch):
 
 
 def test_admin_validator_handles_llm_failure(monkeypatch):
-    import llm.agents.admin_validator as av
-
     monkeypatch.setattr(
         av, "extract_field_details",
         lambda summary, description: {
@@ -126,8 +122,6 @@ def test_admin_validator_handles_llm_failure(monkeypatch):
 
 def test_admin_validator_needs_info_when_no_field_name(monkeypatch):
     """Explicitly cover the early return when field_name is empty."""
-    import llm.agents.admin_validator as av
-
     monkeypatch.setattr(
         av, "extract_field_details",
         lambda summary, description: {
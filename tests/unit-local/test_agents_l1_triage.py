@@ -1,12 +1,15 @@
 import pytest
-from llm.agents.l1_triage_bot import process_ticket as triage
+import llm.agents.l1_triage_bot as l1
+from llm.agents.l1_triage_bot import _clip_for_prompt, process_ticket as triage
 
 class FakeJira:
     def __init__(self, issues=None, fail_comment=False):
         self.issues = issues or []
         self.fail_comment = fail_comment
         self.comments = []
-    def search_issues(self, jql, max_results=10):
+        self.searches = []
+    def search_issues(self, jql, max_results=10, fields=None):
+        self.searches.append({"max_results": max_results, "fields": fields})
         return {"issues": self.issues, "total": len(self.issues)}
     def add_comment(self, key, body):
         if self.fail_comment:
@@ -23,7 +26,6 @@ class FakeConfig: pass
 
 @pytest.fixture(autouse=True)
 def patch_deps(monkeypatch):
-    import llm.agents.l1_triage_bot as l1
     monkeypatch.setattr(l1, "JiraAPI", lambda cfg: FakeJira(
         issues=[
             {"key":"ABC-2","fields":{"summary":"WiFi drops frequently"}},
@@ -40,8 +42,26 @@ def test_triage_posts_comment_and_returns_success():
     assert out["response_length"] > 0
 
 def test_triage_handles_comment_failure(monkeypatch):
-    import llm.agents.l1_triage_bot as l1
     monkeypatch.setattr(l1, "JiraAPI", lambda cfg: FakeJira(fail_comment=True))
     issue = {"fields": {"summary": "VPN fails", "description": "timeout"}}
     out = triage("ABC-9", issue, FakeConfig())
-    assert out["success"] is False
\ No newline at end of file
+    assert out["success"] is False
+
+
+def test_triage_uses_injected_clients(monkeypatch):
+    def _no_construct(cfg):
+        raise AssertionError("should reuse the injected client")
+    monkeypatch.setattr(l1, "JiraAPI", _no_construct)
+    monkeypatch.setattr(l1, "LLMProvider", _no_construct)
+    jira = FakeJira()
+    issue = {"fields": {"summary": "Printer offline", "description": "jammed"}}
+    out = triage("ABC-5", issue, FakeConfig(), jira=jira, llm=FakeLLM(None))
+    assert out["success"] is True
+    assert jira.comments and jira.comments[0][0] == "ABC-5"
+    # recent-ticket context only needs summaries
+    assert jira.searches == [{"max_results": 5, "fields": ["summary"]}]
+
+def test_clip_for_prompt_truncates_long_descriptions():
+    assert _clip_for_prompt("short") == "short"
+    out = _clip_for_prompt("x" * 20, limit=10)
+    assert out.startswith("x" * 10) and out.endswith("[... truncated]")
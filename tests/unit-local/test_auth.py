@@ -0,0 +1,33 @@
+import hashlib
+import hmac
+
+import pytest
+from starlette.requests import Request
+
+import app.auth as auth
+
+
+@pytest.fixture
+def secret(monkeypatch):
+    monkeypatch.setattr(auth, "_SECRET_BYTES", b"s3cret")
+    monkeypatch.setattr(auth, "_SECRET_LEN", 6)
+    return b"s3cret"
+
+
+def _req(headers):
+    return Request({"type": "http", "headers": headers})
+
+
+def test_header_secret_accepts_exact_match_only(secret):
+    assert auth.verify_header_secret(_req([(b"x-webhook-secret", b"s3cret")]))
+    assert not auth.verify_header_secret(_req([(b"x-webhook-secret", b"s3creT")]))
+    assert not auth.verify_header_secret(_req([(b"x-webhook-secret", b"s3cret!")]))
+    assert not auth.verify_header_secret(_req([]))
+
+
+def test_sign_body_is_hmac_with_the_completion_key(monkeypatch):
+    monkeypatch.setattr(auth, "_COMPLETION_KEY", b"cb-key")
+    body = b'{"ok":true}'
+    sig = auth.sign_body(body)
+    assert sig == "sha256=" + hmac.new(b"cb-key", body, hashlib.sha256).hexdigest()
+    assert sig != "sha256=" + hashlib.sha256(b"cb-key" + body).hexdigest()
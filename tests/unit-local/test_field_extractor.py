@@ -0,0 +1,65 @@
+import pytest
+
+from tools.field_extractor import MAX_TEXT_CHARS, FieldExtractor, extract_field_details
+
+
+@pytest.mark.parametrize(
+    "summary, description, name, ftype, options",
+    [
+        (
+            "New field request",
+            "Field name: Customer Tier\nField type: dropdown\nField options: Gold, Silver, Bronze",
+            "Customer Tier", "select", ["Gold", "Silver", "Bronze"],
+        ),
+        ('Please add a field called "Root Cause"', "It should be a paragraph",
+         "Root Cause", "paragraph", []),
+        ("Need a field named Region for tickets", "Options:\n- EMEA\n- APAC\n- AMER",
+         "Region", "select", ["EMEA", "APAC", "AMER"]),
+        ("name: Cost Center", "type = number", "Cost Center", "number", []),
+        ("Something", "yes/no flag please", "", "boolean", []),
+    ],
+)
+def test_extract_field_details(summary, description, name, ftype, options):
+    out = extract_field_details(summary, description)
+    assert out["field_name"] == name
+    assert out["field_type"] == ftype
+    assert out["field_options"] == options
+
+
+def test_extract_field_details_normalizes_raw_text_whitespace():
+    out = extract_field_details("  Create   field\tcalled Foo ", "\n\n text  ")
+    assert out["raw_text"] == "Create field called Foo text"
+
+
+@pytest.mark.parametrize(
+    "text, ftype",
+    [
+        ("a text box, maybe a dropdown", "select"),   # ranked hint beats an earlier one
+        ("long text notes", "paragraph"),
+        ("alphanumeric code", "number"),
+        ("context only", "text"),                     # no soft hint -> default
+    ],
+)
+def test_soft_type_hints_keep_their_ranking(text, ftype):
+    assert extract_field_details("Need a field", text)["field_type"] == ftype
+
+
+@pytest.mark.parametrize(
+    "raw, cleaned",
+    [
+        ("region for tickets", "Region"),
+        ("Region for tickets that need review", "Region For Tickets That"),  # "need" outranks "for"
+        ("Priority into queue", "Priority"),                                  # substring match, as before
+        ('"SLA tier":', "SLA Tier"),
+    ],
+)
+def test_clean_field_name_cuts_at_ranked_stop_word(raw, cleaned):
+    assert FieldExtractor()._clean_field_name(raw) == cleaned
+
+
+def test_extract_field_details_ignores_text_past_the_cap():
+    filler = "x" * MAX_TEXT_CHARS
+    out = extract_field_details("Field name: Region", f"{filler}\nField type: number")
+    assert out["field_name"] == "Region"
+    assert out["field_type"] == "text"   # the type line sits beyond MAX_TEXT_CHARS
+    assert len(out["raw_text"]) == 500
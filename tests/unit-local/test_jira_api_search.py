@@ -0,0 +1,42 @@
+import pytest
+
+import tools.jira_api as ja
+
+
+class _Resp:
+    status_code = 200
+
+    def json(self):
+        return {"issues": [{"key": "ABC-1", "fields": {"summary": "s"}}], "isLast": True}
+
+
+@pytest.fixture
+def api():
+    ja._SEARCH_CACHE.clear()
+    client = object.__new__(ja.JiraAPI)  # skip the /myself probe
+    client.base_url = "https://example.atlassian.net"
+    client.calls = 0
+
+    def _get(url, params=None):
+        client.calls += 1
+        return _Resp()
+
+    client._get = _get
+    yield client
+    ja._SEARCH_CACHE.clear()
+
+
+def test_search_cache_is_off_by_default(api):
+    api.search_cache = False
+    api.search_issues("project = ABC")
+    api.search_issues("project = ABC")
+    assert api.calls == 2
+
+
+def test_search_cache_hits_return_independent_copies(api):
+    api.search_cache = True
+    first = api.search_issues("project = ABC")
+    first["issues"][0]["fields"]["summary"] = "mutated"
+    second = api.search_issues("project = ABC")
+    assert api.calls == 1
+    assert second["issues"][0]["fields"]["summary"] == "s"
@@ -1,6 +1,9 @@
 import json
 import types
 import pytest
+import requests as real_requests
+
+import llm.ollama_client as oc
 
 from core.config import Config
 from llm.ollama_client import call_ollama, _clean_response_text, _get_structured_fallback
@@ -16,25 +19,34 @@ class FakeResp:
             raise Exception(f"HTTP {self.status_code}")
     def json(self):
         return self._payload
+    @property
+    def content(self):
+        return json.dumps(self._payload).encode()
 
 class _FakeReq:
     def __init__(self):
         self.calls = []
         self.to_raise = None
         self.response = FakeResp(200, {"response": '{"approved": true, "auto_create": true, "reason":"ok"}'})
-    def post(self, url, json=None, timeout=None):
-        self.calls.append({"url": url, "json": json, "timeout": timeout})
+    def post(self, url, data=None, headers=None, timeout=None, **kw):
+        body = json.loads(data) if data is not None else kw.get("json")
+        self.calls.append({"url": url, "json": body, "headers": headers, "timeout": timeout})
         if self.to_raise:
             raise self.to_raise
         return self.response
 
+@pytest.fixture(autouse=True)
+def _fresh_response_cache():
+    call_ollama.cache_clear()
+    yield
+    call_ollama.cache_clear()
+
 @pytest.fixture
 def fake_requests(monkeypatch):
     fr = _FakeReq()
-    import llm.ollama_client as oc
-    import requests as real_requests
     fr.exceptions = real_requests.exceptions 
     monkeypatch.setattr(oc, "requests", fr) 
+    monkeypatch.setattr(oc, "_SESSION", fr)
     return fr
 
 @pytest.fixture
@@ -43,6 +55,7 @@ def cfg():
     # keep these deterministic for tests
     c.ollama_url = "http://localhost:11434/api/generate"
     c.model = "llama3.1:8b"
+    c.ollama_keep_alive = "60m"
     return c
 
 # ---- unit tests for cleaners ----
@@ -60,6 +73,17 @@ def test_clean_response_variants():
     t3 = '{"a":{"b":2},"c":3} trailing junk } }'
     assert json.loads(_clean_response_text(t3)) == {"a": {"b": 2}, "c": 3}
 
+    # fence after prose, and an unterminated fence (cut by the stop sequence)
+    t4 = 'Sure thing:\n```json\n{"s": "a } b"}\n```\nthanks'
+    assert json.loads(_clean_response_text(t4)) == {"s": "a } b"}
+    t5 = '```json\n{"k": [1, 2]}\n'
+    assert json.loads(_clean_response_text(t5)) == {"k": [1, 2]}
+
+    # already-clean replies come back as-is (minus surrounding whitespace)
+    assert _clean_response_text('  {"ok": true}\n') == '{"ok": true}'
+    # a leading brace that isn't valid JSON still goes through the full cleaner
+    assert _clean_response_text('{oops} {"ok": 1}') == '{oops} {"ok": 1}'
+
 # ---- happy path ----
 
 def test_call_ollama_returns_parsed_json(fake_requests, cfg):
@@ -70,6 +94,33 @@ def test_call_ollama_returns_parsed_json(fake_requests, cfg):
     # confirms we sent fields to the right url with timeout
     assert fake_requests.calls and fake_requests.calls[0]["url"] == cfg.ollama_url
     assert fake_requests.calls[0]["timeout"] == 60
+    assert fake_requests.calls[0]["headers"]["Content-Type"] == "application/json"
+    # model stays loaded so the static system-prompt prefix is reused
+    assert fake_requests.calls[0]["json"]["keep_alive"] == "60m"
+    assert fake_requests.calls[0]["json"]["prompt"].startswith("SYS\n\n")
+
+def test_keep_alive_numeric_values_are_sent_as_ints(fake_requests, cfg):
+    cfg.ollama_keep_alive = "-1"
+    call_ollama(prompt="Admin field check", system_prompt="SYS", config=cfg)
+    assert fake_requests.calls[0]["json"]["keep_alive"] == -1
+
+def test_call_ollama_caches_identical_requests(fake_requests, cfg):
+    cfg.enable_response_cache = True
+    first = call_ollama(prompt="Admin field check", system_prompt="SYS", config=cfg)
+    first["approved"] = "mutated"
+    second = call_ollama(prompt="Admin field check", system_prompt="SYS", config=cfg)
+    assert len(fake_requests.calls) == 1
+    assert second["approved"] is True  # hits get their own copy
+
+    call_ollama(prompt="Admin field check", system_prompt="OTHER", config=cfg)
+    assert len(fake_requests.calls) == 2
+
+def test_call_ollama_does_not_cache_fallbacks(fake_requests, cfg):
+    cfg.enable_response_cache = True
+    fake_requests.response = FakeResp(200, {"response": "not json at all, sorry"})
+    call_ollama(prompt="Admin field check", system_prompt="SYS", config=cfg)
+    call_ollama(prompt="Admin field check", system_prompt="SYS", config=cfg)
+    assert len(fake_requests.calls) == 2
 
 # ---- short/empty response fallback ----
 
@@ -117,4 +168,15 @@ def test_call_ollama_conn_error(fake_requests, cfg):
 ])
 def test_fallback_buckets_by_prompt(kw, expected_marker):
     fb = _get_structured_fallback(kw, "timeout")
-    assert expected_marker in fb.get("marker", "") or isinstance(fb.get("plan"), list)
\ No newline at end of file
+    assert expected_marker in fb.get("marker", "") or isinstance(fb.get("plan"), list)
+
+
+@pytest.mark.parametrize("prompt, expected_reason_key", [
+    ("Customer cannot login", "error"),                  # whole words only: "customer" != "custom"
+    ("Please enhance the fields on this story", "plan"),  # admin wins over pm
+    ("Cleanup notes from the meeting", "new_summary"),    # pm wins over governance
+])
+def test_fallback_bucket_uses_whole_words_and_priority(prompt, expected_reason_key):
+    fb = _get_structured_fallback(prompt, "timeout")
+    assert expected_reason_key in fb
+    assert fb["fallback_reason"] == "timeout"
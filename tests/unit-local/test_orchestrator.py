@@ -0,0 +1,71 @@
+import pytest
+
+import rules.base_rule
+from workflows import hygiene_engine, orchestrator
+from rules.stale_tickets import StaleTicketRule
+from workflows.orchestrator import Orchestrator
+
+
+@pytest.fixture(autouse=True)
+def _fresh_llm_engines():
+    # Cached LLM engines keep the Jira client they resolved; each test brings its own
+    orchestrator._llm_engine.cache_clear()
+    yield
+    orchestrator._llm_engine.cache_clear()
+
+
+class FakeJira:
+    def search_issues(self, jql, start_at=0, max_results=50, fields=None):
+        return {"issues": [], "total": 0}
+
+    def get_all_custom_fields(self):
+        return {"success": True, "fields": []}
+
+
+def test_orchestrator_sweeps_incrementally_after_first_run(tmp_path, monkeypatch):
+    monkeypatch.setattr(rules.base_rule, "get_jira", lambda: FakeJira())
+    state = tmp_path / "sweep.json"
+    orch = Orchestrator(projects=["SBX"], state_path=str(state))
+
+    first = orch.run()
+    assert first["since"] is None
+    assert state.exists()
+
+    second = orch.run()
+    assert second["since"] == "-6m"  # <1 minute elapsed + 5 minute overlap
+    results = second["rules"]["rules"]
+    assert 'updated >= "-6m"' in results["MissingFieldsRule"]["jql"]
+    assert 'updated >= "-6m"' in results["WorkflowValidatorRule"]["jql"]
+    # stale = *not* updated recently; narrowing it by `since` would match nothing
+    assert "updated >=" not in results["StaleTicketRule"]["jql"]
+
+
+def test_orchestrator_keeps_cursor_on_dry_run(tmp_path):
+    state = tmp_path / "sweep.json"
+    Orchestrator(projects=["SBX"], state_path=str(state)).run()
+    assert not state.exists()  # Jira not configured → nothing was really swept
+
+
+def test_hygiene_skips_settle_inline_and_keep_rule_order():
+    engine = hygiene_engine.HygieneEngine(projects=["SBX"])
+    result = engine.process({"eventType": "manual_report"})["rules"]
+    assert list(result) == [r.name for r in engine.rules]
+    assert result["StaleTicketRule"] == {
+        "rule": "StaleTicketRule", "status": "skipped", "reason": "event_not_handled",
+    }
+    assert result["DuplicateCustomFieldsRule"]["status"] == "dry_run"
+
+
+def test_hygiene_dispatch_skips_rules_not_registered_for_the_event(monkeypatch):
+    engine = hygiene_engine.HygieneEngine(projects=["SBX"])
+    for rule in engine.rules:
+        monkeypatch.setattr(rule, "should_run", lambda _p: pytest.fail("should_run called"))
+    result = engine.process({"eventType": "jira:project_created"})["rules"]
+    assert {r["status"] for r in result.values()} == {"skipped"}
+
+
+def test_hygiene_rules_appended_after_init_still_get_should_run():
+    engine = hygiene_engine.HygieneEngine(projects=["SBX"], enable_stale=False)
+    engine.rules.append(StaleTicketRule(projects=["SBX"]))
+    result = engine.process({"eventType": "scheduled_sweep"})["rules"]
+    assert result["StaleTicketRule"]["status"] == "dry_run"
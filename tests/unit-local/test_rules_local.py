@@ -1,6 +1,7 @@
 # tests/unit-local/test_rules_local.py
 import pytest
 
+from rules.duplicate_custom_fields import DuplicateCustomFieldsRule
 from rules.duplicate_work_item_check import DuplicateCheckRule
 from rules.missing_fields import MissingFieldsRule
 from rules.stale_tickets import StaleTicketRule
@@ -73,16 +74,25 @@ def test_duplicate_execute_dry_run_jql_and_payload_simple():
     assert norm_ws(res["jql"]) == norm_ws(expect)
 
 
-def test_duplicate_execute_escapes_quotes_in_summary():
+def test_duplicate_execute_strips_jql_syntax_from_summary():
     r = DuplicateCheckRule(projects=["ABC"], lookback_days=3, enabled=True)
     r.jira = None
 
-    data = ev_issue_updated("ABC-9", 'User says: "cannot login"')
+    data = ev_issue_updated("ABC-9", 'User says: "cannot login" ~ help?? \\ login')
     res = r.execute(data)
 
     assert res["status"] == "dry_run"
-    # Expect the inner quote to be escaped for JQL
-    assert '\\"cannot login\\"' in res["jql"]
+    # Only significant words survive (deduped); quotes / JQL operators never reach the query
+    assert 'text ~ "User says cannot login help" ' in res["jql"]
+
+
+def test_duplicate_skips_when_summary_has_no_search_terms():
+    r = DuplicateCheckRule(enabled=True)
+    r.jira = None
+
+    res = r.execute(ev_issue_created("ABC-10", '?? "" !!'))
+    assert res["status"] == "skipped"
+    assert res["reason"] == "no_search_terms"
 
 
 def test_duplicate_skips_when_no_issue_context():
@@ -174,6 +184,15 @@ def test_stale_execute_dry_run_jql(days, expect_fragment):
     assert 'labels not in ("stale")' in jql
 
 
+def test_stale_jql_escapes_quotes_and_backslashes_in_values():
+    r = StaleTicketRule(days=7, exclude_statuses=['Won"t Do'], exclude_labels=["a\\b"])
+    r.jira = None
+
+    jql = r.execute(ev_sweep())["jql"]
+    assert 'status not in ("Won\\"t Do")' in jql
+    assert 'labels not in ("a\\\\b")' in jql
+
+
 # ----------------------------
 # WorkflowValidatorRule
 # ----------------------------
@@ -240,4 +259,30 @@ def test_workflow_validator_comment_builder_handles_empty_and_populated():
 
     populated_msg = r._build_comment(["Missing assignee", "Missing field: Story Points"])
     # Should include both violations in a single line after the base text
-    assert "⚠️ Workflow validation: Missing assignee; Missing field: Story Points" == populated_msg
\ No newline at end of file
+    assert "⚠️ Workflow validation: Missing assignee; Missing field: Story Points" == populated_msg
+
+
+# ----------------------------
+# DuplicateCustomFieldsRule grouping
+# ----------------------------
+
+def test_duplicate_custom_fields_groups_by_normalized_name_and_type():
+    r = DuplicateCustomFieldsRule(ignore_names=["Ignored"])
+    select = "com.atlassian.jira.plugin.system.customfieldtypes:select"
+    fields = [
+        {"id": "cf_1", "name": "Team", "schema": {"custom": select}},
+        {"id": "cf_2", "name": "  team ", "schema": {"custom": select}},
+        {"id": "cf_3", "name": "TEAM", "schema": None, "type": "text"},   # different type
+        {"id": "cf_4", "name": "Ignored", "schema": {"custom": select}},
+        {"id": "cf_5", "name": "Ignored", "schema": {"custom": select}},
+        {"id": "cf_6", "name": ""},
+    ]
+    groups = r._find_duplicates(fields)
+    assert len(groups) == 1
+    g = groups[0]
+    assert g["normalized_name"] == "team" and g["by_type"] == select
+    assert [f["id"] for f in g["fields"]] == ["cf_1", "cf_2"]
+
+    r.require_same_type = False
+    groups = r._find_duplicates(fields)
+    assert groups[0]["count"] == 3 and groups[0]["by_type"] is None
@@ -144,4 +144,121 @@ def test_workflow_validator_ok_path_builds_per_issue_violations_and_writes():
     assert res["actions"]["comments"] == 2
     assert res["actions"]["labels"] == 2
     keys_commented = [k for k, _ in fake._comments]
-    assert set(keys_commented) == {"WFK-1", "WFK-3"}
\ No newline at end of file
+    assert set(keys_commented) == {"WFK-1", "WFK-3"}
+
+
+def test_missing_fields_fetches_all_pages_in_order():
+    fake = FakeJira(issues=[{"key": f"SBX-{i}"} for i in range(1, 8)])
+    r = MissingFieldsRule(required=["Assignee"], projects=["SBX"], batch_size=2, max_results=6)
+    r.jira = fake
+
+    res = r.execute({"eventType": "scheduled_sweep"})
+    assert res["status"] == "ok"
+    # 3 pages of 2 fetched (capped by max_results), results keep Jira's order
+    assert res["issue_keys"] == [f"SBX-{i}" for i in range(1, 7)]
+
+
+def test_duplicate_check_skips_updates_with_unchanged_summary():
+    fake = FakeJira(issues=[{"key": "ABC-8", "fields": {"summary": "Printer on fire"}}])
+    r = DuplicateCheckRule(projects=["ABC"])
+    r.jira = fake
+
+    issue = {"key": "ABC-9", "fields": {"summary": "Printer on fire again"}}
+    assert r.execute({"eventType": "issue_updated", "issue": issue})["status"] == "ok"
+    # same summary (e.g. only status changed) → no second search
+    res = r.execute({"eventType": "issue_updated", "issue": issue})
+    assert res["status"] == "skipped" and res["reason"] == "unchanged"
+
+    issue["fields"]["summary"] = "Printer smoking"
+    assert r.execute({"eventType": "issue_updated", "issue": issue})["status"] == "ok"
+
+
+def test_stale_tickets_labels_in_bulk_batches_when_supported():
+    class BulkJira(FakeJira):
+        def __init__(self, issues):
+            super().__init__(issues)
+            self.bulk_calls = []
+
+        def bulk_add_label(self, keys, label):
+            self.bulk_calls.append((list(keys), label))
+            return {"success": True}
+
+    fake = BulkJira([{"key": f"ABC-{i}"} for i in range(1, 6)])
+    r = StaleTicketRule(days=7, projects=["ABC"], add_label="stale", write_delay_sec=0)
+    r.WRITE_BATCH_SIZE = 2
+    r.jira = fake
+
+    res = r.execute({"eventType": "scheduled_sweep"})
+    assert res["actions"]["labels"] == 5
+    assert [len(keys) for keys, _ in fake.bulk_calls] == [2, 2, 1]
+    assert fake._labels_added == []  # no per-issue fallback needed
+
+
+def test_workflow_validator_reads_required_fields_by_resolved_id():
+    class IdJira(FakeJira):
+        def __init__(self, issues):
+            super().__init__(issues)
+            self.requested_fields = None
+
+        def resolve_field_ids(self, names):
+            return {"Story Points": "customfield_10016"}
+
+        def search_issues(self, jql, start_at=0, max_results=50, fields=None):
+            self.requested_fields = fields
+            return super().search_issues(jql, start_at, max_results, fields)
+
+    fake = IdJira([
+        {"key": "WFK-1", "fields": {"assignee": {"displayName": "A"}, "customfield_10016": 3}},
+        {"key": "WFK-2", "fields": {"assignee": {"displayName": "B"}, "customfield_10016": None}},
+    ])
+    r = WorkflowValidatorRule(statuses=["In Progress"], require_fields=["Story Points"])
+    r.jira = fake
+
+    res = r.execute({"eventType": "scheduled_sweep"})
+    assert fake.requested_fields == ["key", "assignee", "customfield_10016"]
+    assert res["violations"] == {"WFK-2": ["Missing field: Story Points"]}
+
+
+def test_missing_fields_skips_writes_when_no_actions_configured():
+    fake = FakeJira(issues=[{"key": "SBX-1"}, {"key": "SBX-2"}])
+    r = MissingFieldsRule(required=["labels"], projects=["SBX"])
+    r.jira = fake
+    r._comment_keys = r._label_keys = lambda *a, **k: pytest.fail("no write expected")
+
+    res = r.execute({"eventType": "scheduled_sweep"})
+    assert res["issues_flagged"] == 2
+    assert res["actions"] == {"comments": 0, "labels": 0}
+
+
+def test_stale_tickets_follows_next_page_token():
+    class CursorJira(FakeJira):
+        def search_issues(self, jql, start_at=0, max_results=50, fields=None, next_page_token=None):
+            start = int(next_page_token or 0)
+            window = self._issues[start:start + max_results]
+            end = start + len(window)
+            return {"issues": window, "next_page_token": str(end) if end < len(self._issues) else None}
+
+    fake = CursorJira([{"key": f"ABC-{i}"} for i in range(1, 6)])
+    r = StaleTicketRule(days=7, projects=["ABC"], batch_size=2, max_results=4)
+    r.jira = fake
+
+    res = r.execute({"eventType": "scheduled_sweep"})
+    assert res["issue_keys"] == ["ABC-1", "ABC-2", "ABC-3", "ABC-4"]
+
+
+def test_stale_tickets_label_fallback_counts_only_accepted_writes():
+    class RejectingJira(FakeJira):
+        def bulk_add_label(self, keys, label):
+            return {"error": "HTTP 400"}
+
+        def add_label(self, key, label):
+            super().add_label(key, label)
+            return {"error": "HTTP 403"} if key == "ABC-2" else {"success": True}
+
+    fake = RejectingJira([{"key": f"ABC-{i}"} for i in range(1, 4)])
+    r = StaleTicketRule(days=7, projects=["ABC"], add_label="stale", write_delay_sec=0)
+    r.jira = fake
+
+    res = r.execute({"eventType": "scheduled_sweep"})
+    assert len(fake._labels_added) == 3  # every key was retried one by one
+    assert res["actions"]["labels"] == 2
@@ -11,7 +11,17 @@ def test_render_basic_and_nested():
     out = runtime.render(tmpl, ctx)
     # dict serialized to json string
     assert "Hello Tori, you have 3 tasks" in out
-    assert 'data={"a": [1, 2]}' in out
+    assert 'data={"a":[1,2]}' in out
+
+def test_render_reuses_parsed_template_and_blanks_missing_values():
+    tmpl = "{{ a }}-{{a.b}}-{{ missing }}!"
+    assert runtime.render(tmpl, {"a": 1}) == "1--!"
+    assert runtime.render(tmpl, {"a": {"b": "x"}}) == '{"b":"x"}-x-!'
+    assert runtime.render("plain", {}) == "plain"
+    assert runtime.render(None, {}) == ""
+
+def test_render_json_is_key_sorted_and_tolerates_non_str_keys():
+    assert runtime.render("{{ d }}", {"d": {"b": 1, "a": {2: "x"}}}) == '{"a":{"2":"x"},"b":1}'
 
 def test_load_prompt_from_temp_dir(monkeypatch):
     with tempfile.TemporaryDirectory() as d:
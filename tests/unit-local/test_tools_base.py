@@ -0,0 +1,67 @@
+import time
+
+import pytest
+
+import tools.base as tb
+from tools.base import TTLCache, TokenBucket, retry
+
+
+def test_ttl_cache_evicts_least_recently_used_and_expires():
+    c = TTLCache(maxsize=2)
+    c.set("a", 1)
+    c.set("b", 2)
+    c.get("a")          # "b" is now least recently used
+    c.set("c", 3)
+    assert c.get("b") is None and c.get("a") == 1 and c.get("c") == 3
+
+    short = TTLCache(ttl=0.01)
+    short.set("k", "v")
+    time.sleep(0.02)
+    assert short.get("k", "gone") == "gone"
+
+
+def test_token_bucket_bursts_then_paces():
+    bucket = TokenBucket(rate=50, capacity=3)
+    t0 = time.monotonic()
+    for _ in range(3):
+        bucket.acquire()
+    assert time.monotonic() - t0 < 0.01      # burst served from the bucket
+
+    bucket.acquire()                          # empty: waits ~1/rate
+    assert time.monotonic() - t0 >= 0.015
+
+
+def test_token_bucket_pause_blocks_until_elapsed():
+    bucket = TokenBucket(rate=1000, capacity=5)
+    bucket.pause(0.05)
+    t0 = time.monotonic()
+    bucket.acquire()
+    assert time.monotonic() - t0 >= 0.04
+
+
+def test_retry_retries_transient_errors_only(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(tb.time, "sleep", sleeps.append)
+
+    calls = []
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise ConnectionError("blip")
+        return "ok"
+    assert retry(flaky, attempts=3, delay_sec=0.5) == "ok"
+    assert len(sleeps) == 2 and sleeps[1] > sleeps[0]
+
+    def broken():
+        calls.append(1)
+        raise KeyError("nope")
+    calls.clear()
+    with pytest.raises(KeyError):
+        retry(broken, attempts=3)
+    assert len(calls) == 1
+
+    def down():
+        raise TimeoutError("still down")
+    sleeps.clear()
+    assert retry(down, attempts=3, delay_sec=0.1) is None
+    assert len(sleeps) == 2  # no pause after the final attempt
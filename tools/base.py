@@ -1,9 +1,13 @@
 # tools/base.py
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Callable
+from typing import Any, Dict, Hashable, Optional, Callable
+from collections import OrderedDict
+import random
+import threading
 import time
-from core.config import Config
+import requests
+from core.config import Config, get_config
 from core.logging import logger
 
 @dataclass
@@ -18,32 +22,140 @@ class Tool:
     Very small base for shared behavior (config access + logging).
     """
     def __init__(self, config: Optional[Config] = None) -> None:
-        self.config = config or Config()
+        self.config = config or get_config()
         self.logger = logger
 
+# Transient failures worth another attempt; anything else is raised at once
+RETRYABLE_ERRORS: tuple[type[BaseException], ...] = (
+    ConnectionError,
+    TimeoutError,
+    requests.ConnectionError,
+    requests.Timeout,
+)
+MAX_RETRY_WAIT_SEC = 10.0
+
+
 def retry(
     fn: Callable[[], Any],
     *,
     attempts: int = 3,
     delay_sec: float = 0.5,
     backoff: float = 2.0,
+    retry_on: tuple[type[BaseException], ...] = RETRYABLE_ERRORS,
+    deadline_sec: float | None = None,
     swallow: bool = True,
 ) -> Any:
     """
     Tiny retry helper for flaky I/O. Use only around safe idempotent GETs.
+    Only `retry_on` errors are retried (with jittered exponential backoff, and
+    never past `deadline_sec` from the first call); others propagate immediately.
     """
-    tries = attempts
+    if attempts <= 1:
+        try:
+            return fn()
+        except retry_on:
+            if swallow:
+                return None
+            raise
+
+    deadline = time.monotonic() + deadline_sec if deadline_sec else None
     wait = max(0.0, delay_sec)
-    last_err: Exception | None = None
-    while tries > 0:
+    last_err: BaseException | None = None
+    for n in range(attempts):
         try:
             return fn()
-        except Exception as e:
+        except retry_on as e:
             last_err = e
-            logger.warning(f"retry: error={e} tries_left={tries-1}")
-            time.sleep(wait)
+            tries_left = attempts - n - 1
+            logger.warning("retry: error=%s tries_left=%d", e, tries_left)
+            if not tries_left:
+                break
+            pause = min(wait + random.uniform(0, wait * 0.1), MAX_RETRY_WAIT_SEC)
+            if deadline is not None and time.monotonic() + pause > deadline:
+                break
+            time.sleep(pause)
             wait *= max(1.0, backoff)
-            tries -= 1
     if swallow:
         return None
-    raise last_err or RuntimeError("retry failed")
\ No newline at end of file
+    raise last_err or RuntimeError("retry failed")
+
+class TTLCache:
+    """
+    Small thread-safe LRU cache with optional per-entry expiry (ttl=None keeps
+    entries until evicted by size). Enough for per-process memoization of
+    slow-changing Jira/LLM lookups without pulling in cachetools.
+    """
+    _MISSING = object()
+
+    def __init__(self, maxsize: int = 128, ttl: float | None = None) -> None:
+        self.maxsize = max(1, maxsize)
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key, self._MISSING)
+            if item is self._MISSING:
+                return default
+            expires, value = item
+            if expires and expires < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires = time.monotonic() + self.ttl if self.ttl else 0.0
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.pop(key, None)
+        return default if item is None else item[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: refills at `rate` tokens/sec up to `capacity`.
+    acquire() returns immediately while tokens remain and only blocks once the
+    bucket is empty; pause() empties it for a while (e.g. on HTTP 429 Retry-After).
+    """
+
+    def __init__(self, rate: float = 5.0, capacity: float = 10.0) -> None:
+        self.rate = max(0.001, float(rate))
+        self.capacity = max(1.0, float(capacity))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now >= self._updated:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= tokens:
+                        self._tokens -= tokens
+                        return
+                    wait = (tokens - self._tokens) / self.rate
+                else:
+                    wait = self._updated - now  # paused
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hand out nothing for `seconds`, then refill from empty."""
+        with self._lock:
+            self._tokens = 0.0
+            self._updated = max(self._updated, time.monotonic() + max(0.0, seconds))
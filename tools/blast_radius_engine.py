@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from core.logging import logger
 
+_MISSING = object()  # "key absent" marker, distinct from an explicit None
 
 def _project_ids_known(ctx: dict) -> bool:
     """
@@ -10,46 +11,58 @@ def _project_ids_known(ctx: dict) -> bool:
     Jira may omit project scoping on GET /field/{id}/context, so absence must be treated as unknown,
     not "global".
     """
-    if ctx.get("_projects_loaded") is True:
-        return True
-    if ctx.get("_projects_loaded") is False:
-        return False
+    loaded = ctx.get("_projects_loaded")
+    if loaded is True or loaded is False:
+        return loaded
 
-    # If the key exists but value is None, treat as unknown.
-    if "projectIds" in ctx:
-        return ctx.get("projectIds") is not None
-    if "projects" in ctx:
-        return ctx.get("projects") is not None
+    # One lookup per key: if the key exists but value is None, treat as unknown.
+    value = ctx.get("projectIds", _MISSING)
+    if value is not _MISSING:
+        return value is not None
+    value = ctx.get("projects", _MISSING)
+    return value is not _MISSING and value is not None
 
-    return False
 
-
-def _extract_project_ids(ctx: dict) -> list[str]:
+def _extract_project_ids(ctx: dict) -> tuple[list[str], frozenset[str]]:
     """
     Jira Cloud context payloads aren't always consistent.
     Support the common shapes:
       - {"projectIds": ["10034", ...]}
       - {"projects": [{"id":"10034", ...}, ...]}
       - {"projects": [{"projectId":"10034", ...}, ...]}
+
+    Returns (ids, id_set): the list keeps duplicates/order for counting, the set
+    serves membership checks.
     """
+    # authoritative injected form (may be empty => global, when known)
     project_ids = ctx.get("projectIds")
     if isinstance(project_ids, list):
-        # list may be empty => global (when known)
-        return [str(x) for x in project_ids if x is not None]
+        out = [str(x) for x in project_ids if x is not None]
+        return out, frozenset(out)
 
+    # alternative shapes seen in some payloads: projects: [{id},{projectId}]
     projects = ctx.get("projects")
     if isinstance(projects, list):
-        out: list[str] = []
+        out = []
         for p in projects:
-            if not isinstance(p, dict):
-                continue
-            if p.get("id") is not None:
-                out.append(str(p["id"]))
-            elif p.get("projectId") is not None:
-                out.append(str(p["projectId"]))
-        return out
+            if isinstance(p, dict):
+                pid = p.get("id") or p.get("projectId")
+                if pid is not None:
+                    out.append(str(pid))
+        return out, frozenset(out)
+
+    # Jira DC style might include "allProjects"/"projectIds" elsewhere; default empty
+    return [], frozenset()
 
-    return []
+
+def _is_global_ctx(ctx: dict, pids: list[str]) -> bool:
+    # explicit flag
+    if isinstance(ctx.get("isGlobalContext"), bool):
+        return ctx["isGlobalContext"]
+    if isinstance(ctx.get("is_global_context"), bool):
+        return ctx["is_global_context"]
+    # empty project list implies global in Jira Cloud context model
+    return len(pids) == 0
 
 
 def analyze_blast_radius(
@@ -88,53 +101,19 @@ def analyze_blast_radius(
     if target_project_id is None:
         raise TypeError("analyze_blast_radius() missing required argument: 'target_project_id'")
 
-    # --- Helper: extract project ids from a context object (various shapes) ---
-    def _ctx_project_ids(ctx: dict) -> list[str]:
-        # authoritative injected form
-        if isinstance(ctx.get("projectIds"), list):
-            return [str(x) for x in ctx.get("projectIds") if x is not None]
-
-        # alternative shapes seen in some payloads: projects: [{id},{projectId}]
-        projects = ctx.get("projects")
-        if isinstance(projects, list):
-            out = []
-            for p in projects:
-                if isinstance(p, dict):
-                    pid = p.get("id") or p.get("projectId")
-                    if pid is not None:
-                        out.append(str(pid))
-            return out
-
-        # Jira DC style might include "allProjects"/"projectIds" elsewhere; default empty
-        return []
-
-    def _is_global_ctx(ctx: dict) -> bool:
-        # explicit flag
-        if isinstance(ctx.get("isGlobalContext"), bool):
-            return ctx["isGlobalContext"]
-        if isinstance(ctx.get("is_global_context"), bool):
-            return ctx["is_global_context"]
-        # empty project list implies global in Jira Cloud context model
-        return len(_ctx_project_ids(ctx)) == 0
-
     tpid = str(target_project_id)
 
+    # Project ids per context, extracted once and reused by every check below
+    ctx_pids, ctx_psets = zip(*map(_extract_project_ids, contexts)) if contexts else ((), ())
+
     # Determine applicable contexts (those that include the target project)
-    applicable = []
-    for ctx in contexts:
-        pids = _ctx_project_ids(ctx)
-        if pids:
-            if tpid in set(pids):
-                applicable.append(ctx)
-
-    # If we couldn't match any project-scoped context, the applicable one is global/default (if present)
-    # BUT: If Jira omitted project mappings entirely, we should fail-closed instead of guessing.
-    any_known_project_map = any(isinstance(c.get("projectIds"), list) or isinstance(c.get("projects"), list) for c in contexts)
-    any_nonempty_project_map = any(len(_ctx_project_ids(c)) > 0 for c in contexts)
+    applicable = [i for i, pset in enumerate(ctx_psets) if tpid in pset]
 
     if not applicable:
+        # If we couldn't match any project-scoped context, the applicable one is global/default (if present)
+        # BUT: If Jira omitted project mappings entirely, we should fail-closed instead of guessing.
         # If we have *zero* non-empty project mappings across all contexts, we can't safely decide.
-        if not any_nonempty_project_map and len(contexts) > 1:
+        if len(contexts) > 1 and not any(ctx_pids):
             return {
                 "selected_context_id": None,
                 "is_global": False,
@@ -149,13 +128,12 @@ def analyze_blast_radius(
             }
 
         # Otherwise, choose a global context if present
-        global_ctxs = [c for c in contexts if _is_global_ctx(c)]
-        selected = global_ctxs[0] if global_ctxs else (contexts[0] if contexts else None)
+        idx = next((i for i, c in enumerate(contexts) if _is_global_ctx(c, ctx_pids[i])), 0)
     else:
-        # Choose the most specific context (fewest projects)
-        applicable_sorted = sorted(applicable, key=lambda c: len(_ctx_project_ids(c)) or 10**9)
-        selected = applicable_sorted[0]
+        # Choose the most specific context (fewest projects; first one wins ties)
+        idx = min(applicable, key=lambda i: len(ctx_pids[i]))
 
+    selected = contexts[idx] if contexts else None
     if not selected:
         return {
             "selected_context_id": None,
@@ -167,8 +145,8 @@ def analyze_blast_radius(
         }
 
     selected_id = str(selected.get("id") or selected.get("contextId") or "")
-    selected_pids = _ctx_project_ids(selected)
-    is_global = _is_global_ctx(selected)
+    selected_pids = ctx_pids[idx]
+    is_global = _is_global_ctx(selected, selected_pids)
 
     # Risk level rules
     if is_global:
@@ -176,7 +154,7 @@ def analyze_blast_radius(
         reason = "Applicable context for target project is GLOBAL; option changes affect all projects in that context."
         project_count = 0
     else:
-        project_count = len(set(selected_pids))
+        project_count = len(ctx_psets[idx])
         if project_count <= 1:
             risk_level = "LOW"
             reason = "Applicable context is project-scoped to a single project."
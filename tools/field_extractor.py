@@ -4,7 +4,8 @@ Field Extractor - Parse field requests from natural language
 """
 from __future__ import annotations
 import re
-from typing import Dict, List
+from itertools import chain, islice
+from typing import Dict, Iterable, List
 from core.logging import logger
 
 # Normalize a wide variety of type phrases into Jira-friendly tokens
@@ -31,8 +32,96 @@ TYPE_SYNONYMS = {
     "number": "number",
 }
 
+# Compiled once at import; the extractor runs on every admin field request
+_NAME_PATTERNS = [
+    re.compile(p, re.I | re.M)
+    for p in (
+        r"(?:^|\n)\s*(?:the\s+field\s+)?field\s*name\s*(?:i\s*would\s*like\s*is|is|=|:)\s*(.+)$",
+        r"(?:^|\n)\s*name\s*[:=]\s*(.+)$",
+        r'field\s+called\s+"([^"]+)"',
+        r"field\s+called\s+([^\"\n,\.]+)",
+        r"create.*?field.*?called[\"\s]*([^\"'\n,\.]+)",
+        r"field.*?named[\"\s]*([^\"'\n,\.]+)",
+    )
+]
+# (pattern, group holding the type)
+_TYPE_PATTERNS = [
+    (re.compile(r"(?:^|\n)\s*field\s*type\s*(?:is|=|:)\s*([A-Za-z /-]+)", re.I | re.M), 1),
+    (re.compile(r"(?:^|\n).*\b(type)\b\s*[:=]\s*([A-Za-z /-]+)", re.I | re.M), 2),
+]
+# Soft type hints fused into one alternation, branches in priority order. The
+# first branch in this list that matches anywhere in the text wins, so
+# _soft_type() keeps the best-ranked match rather than the leftmost one.
+_SOFT_TYPE_RE = re.compile(
+    r"(?P<single>\b(?:single\s*select|dropdown|drop\s*down|picklist)\b)"
+    r"|(?P<multi>\b(?:multi\s*select|multiselect)\b)"
+    r"|(?P<checkbox>\bcheckbox(?:es)?\b)"
+    r"|(?P<yesno>\byes\/?no\b)"
+    r"|(?P<date>\bdate(?:\s*selector)?\b)"
+    r"|(?P<paragraph>\bparagraph|long\s*text\b)"
+    r"|(?P<url>\burl\b)"
+    r"|(?P<attachment>\battachment\b)"
+    r"|(?P<number>\bnumber|numeric|integer\b)"
+    r"|(?P<text>\btext\b)",
+    re.I,
+)
+_SOFT_TYPE_VALUES = {
+    "single": "single select",
+    "multi": "multi select",
+    "checkbox": "checkbox",
+    "yesno": "yes/no",
+    "date": "date",
+    "paragraph": "paragraph",
+    "url": "url",
+    "attachment": "attachment",
+    "number": "number",
+    "text": "text",
+}
+_SOFT_TYPE_RANK = {g: i for i, g in enumerate(_SOFT_TYPE_VALUES)}
+
+_OPTIONS_BLOCK_RE = re.compile(r"(?:^|\n)\s*field\s*options?\s*(?:=|:|-)?\s*(.+?)(?:\n\s*\n|\Z)", re.I | re.S)
+_OPTIONS_BULLETS_RE = re.compile(r"(?:^|\n)\s*[-*•]\s*.+(?:\n\s*[-*•]\s*.+)+", re.I)
+_OPTIONS_INLINE_RE = re.compile(r"(?:options?|with)\s*[:=]?\s*([^\.\n]+)", re.I)
+# Trailing words that end a field name ("Region for tickets" -> "Region"). Plain
+# substrings, ranked: the earliest-listed word present anywhere decides the cut.
+_NAME_STOP_WORDS = ("need", "with", "for", "in", "that", "which", "options")
+_NAME_STOP_RE = re.compile(r" (%s)" % "|".join(_NAME_STOP_WORDS), re.I)
+_NAME_STOP_RANK = {w: i for i, w in enumerate(_NAME_STOP_WORDS)}
+_OPTION_SEP_RE = re.compile(r"[;,]")
+MAX_OPTIONS = 50
+# Field requests state name/type/options up front; long descriptions (logs,
+# pasted specs) past this point only slow the regex scans down.
+MAX_TEXT_CHARS = 4096
+# Field types whose options must be listed explicitly
+SELECT_TYPES = frozenset({"select", "multiselect"})
+_BULLET_CHARS = " -*•\t"
+_OPTION_STOPWORDS = frozenset({"the", "options", "list", "with", "following"})
+
+def _soft_type(text: str) -> str:
+    """Best-ranked soft type hint in text (one regex pass), or ""."""
+    best = None
+    for m in _SOFT_TYPE_RE.finditer(text):
+        group = m.lastgroup
+        if best is None or _SOFT_TYPE_RANK[group] < _SOFT_TYPE_RANK[best]:
+            best = group
+            if _SOFT_TYPE_RANK[best] == 0:
+                break
+    return _SOFT_TYPE_VALUES[best] if best else ""
+
+def _name_cut(name: str) -> int:
+    """Index of the best-ranked stop word in name (one regex pass), or -1."""
+    best_rank, cut = len(_NAME_STOP_WORDS), -1
+    for m in _NAME_STOP_RE.finditer(name):
+        rank = _NAME_STOP_RANK[m.group(1).lower()]
+        if rank < best_rank:
+            best_rank, cut = rank, m.start()
+            if rank == 0:
+                break
+    return cut
+
 def _norm(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip())
+    # split()/join collapse whitespace in C, without a regex pass
+    return " ".join((s or "").split())
 
 def _normalize_type(t: str) -> str:
     t = _norm(t).lower()
@@ -42,23 +131,26 @@ def _parse_options(block: str) -> List[str]:
     """Parse options from a labeled block or bullet list."""
     if not block:
         return []
-    lines = [l.strip(" -*•\t") for l in block.strip().splitlines() if l.strip()]
-    if len(lines) == 1 and ("," in lines[0] or ";" in lines[0]):
-        parts = re.split(r"[;,]", lines[0])
-        lines = [p.strip() for p in parts if p.strip()]
-    cleaned = [
-        o for o in lines
-        if o and o.lower() not in {"the", "options", "list", "with", "following"}
-    ]
-    return cleaned[:50]
+    # Lazily stripped lines; peek at two to spot the single "a, b; c" line form
+    lines = (l.strip(_BULLET_CHARS) for l in block.strip().splitlines() if l.strip())
+    first = next(lines, None)
+    if first is None:
+        return []
+    second = next(lines, None)
+    if second is None and ("," in first or ";" in first):
+        items: Iterable[str] = (p.strip() for p in _OPTION_SEP_RE.split(first))
+    else:
+        items = chain((first,) if second is None else (first, second), lines)
+    # Stops reading once MAX_OPTIONS options are accepted
+    return list(islice((o for o in items if o and o.lower() not in _OPTION_STOPWORDS), MAX_OPTIONS))
 
 class FieldExtractor:
     """Extract field details from Jira ticket text (summary + description)."""
 
     def extract_field_details(self, summary: str, description: str) -> Dict:
-        text = (summary or "") + "\n" + (description or "")
-        preview = _norm(text)[:120]
-        logger.debug(f"FieldExtractor: analyzing '{preview}...'")
+        text = ((summary or "") + "\n" + (description or ""))[:MAX_TEXT_CHARS]
+        norm_text = _norm(text)
+        logger.debug("FieldExtractor: analyzing '%.120s...'", norm_text)
 
         field_name = self._extract_field_name(text)
         field_type_raw = self._extract_field_type(text)
@@ -70,99 +162,70 @@ class FieldExtractor:
 
         if field_name:
             field_name = self._clean_field_name(field_name)
-            logger.debug(f"FieldExtractor: cleaned name='{field_name}'")
+            logger.debug("FieldExtractor: cleaned name='%s'", field_name)
 
         result = {
             "field_name": field_name,
             "field_type": field_type,
             "field_options": options,
-            "raw_text": _norm(text)[:500],
+            "raw_text": norm_text[:500],
         }
-        logger.info(f"FieldExtractor: result={result}")
+        logger.info("FieldExtractor: result=%s", result)
         return result
 
     # ---------- parsers ----------
     def _extract_field_name(self, text: str) -> str:
-        patterns = [
-            r"(?:^|\n)\s*(?:the\s+field\s+)?field\s*name\s*(?:i\s*would\s*like\s*is|is|=|:)\s*(.+)$",
-            r"(?:^|\n)\s*name\s*[:=]\s*(.+)$",
-            r'field\s+called\s+"([^"]+)"',
-            r"field\s+called\s+([^\"\n,\.]+)",
-            r"create.*?field.*?called[\"\s]*([^\"'\n,\.]+)",
-            r"field.*?named[\"\s]*([^\"'\n,\.]+)",
-        ]
-        for i, pat in enumerate(patterns):
-            m = re.search(pat, text, flags=re.I | re.M)
+        for i, pat in enumerate(_NAME_PATTERNS):
+            m = pat.search(text)
             if m:
                 candidate = m.group(1).strip().strip('"\'')
                 if candidate:
-                    logger.debug(f"FieldExtractor: name pattern {i+1} -> '{candidate}'")
+                    logger.debug("FieldExtractor: name pattern %d -> '%s'", i + 1, candidate)
                     return candidate
         return ""
 
     def _extract_field_type(self, text: str) -> str:
-        patterns = [
-            r"(?:^|\n)\s*field\s*type\s*(?:is|=|:)\s*([A-Za-z /-]+)",
-            r"(?:^|\n).*\b(type)\b\s*[:=]\s*([A-Za-z /-]+)",
-        ]
-        for i, pat in enumerate(patterns):
-            m = re.search(pat, text, flags=re.I | re.M)
+        for i, (pat, group) in enumerate(_TYPE_PATTERNS):
+            m = pat.search(text)
             if m:
-                raw = (m.group(1 if i == 0 else 2)).strip()
-                logger.debug(f"FieldExtractor: type pattern {i+1} -> '{raw}'")
+                raw = m.group(group).strip()
+                logger.debug("FieldExtractor: type pattern %d -> '%s'", i + 1, raw)
                 return raw
-        soft_map = [
-            (r"\b(single\s*select|dropdown|drop\s*down|picklist)\b", "single select"),
-            (r"\b(multi\s*select|multiselect)\b", "multi select"),
-            (r"\bcheckbox(es)?\b", "checkbox"),
-            (r"\byes\/?no\b", "yes/no"),
-            (r"\bdate(\s*selector)?\b", "date"),
-            (r"\bparagraph|long\s*text\b", "paragraph"),
-            (r"\burl\b", "url"),
-            (r"\battachment\b", "attachment"),
-            (r"\bnumber|numeric|integer\b", "number"),
-            (r"\btext\b", "text"),
-        ]
-        for rx, val in soft_map:
-            if re.search(rx, text, flags=re.I):
-                logger.debug(f"FieldExtractor: type soft match '{val}'")
-                return val
-        return ""
+        val = _soft_type(text)
+        if val:
+            logger.debug("FieldExtractor: type soft match '%s'", val)
+        return val
 
     def _extract_options(self, text: str, field_type: str) -> List[str]:
-        m = re.search(r"(?:^|\n)\s*field\s*options?\s*(?:=|:|-)?\s*(.+?)(?:\n\s*\n|\Z)",
-                      text, flags=re.I | re.S)
+        m = _OPTIONS_BLOCK_RE.search(text)
         if m:
             opts = _parse_options(m.group(1))
             if opts:
-                logger.debug(f"FieldExtractor: options (block) {opts}")
+                logger.debug("FieldExtractor: options (block) %s", opts)
                 return opts
-        m2 = re.search(r"(?:^|\n)\s*[-*•]\s*.+(?:\n\s*[-*•]\s*.+)+", text, flags=re.I)
+        m2 = _OPTIONS_BULLETS_RE.search(text)
         if m2:
             opts = _parse_options(m2.group(0))
             if opts:
-                logger.debug(f"FieldExtractor: options (bullets) {opts}")
+                logger.debug("FieldExtractor: options (bullets) %s", opts)
                 return opts
-        m3 = re.search(r"(?:options?|with)\s*[:=]?\s*([^\.\n]+)", text, flags=re.I)
+        m3 = _OPTIONS_INLINE_RE.search(text)
         if m3:
             opts = _parse_options(m3.group(1))
             if opts:
-                logger.debug(f"FieldExtractor: options (inline) {opts}")
+                logger.debug("FieldExtractor: options (inline) %s", opts)
                 return opts
-        if field_type in {"select", "multiselect"}:
+        if field_type in SELECT_TYPES:
             logger.debug("FieldExtractor: no explicit options found for select/multiselect")
         return []
 
     def _clean_field_name(self, field_name: str) -> str:
         field_name = field_name.strip(" :;,.\"'")
-        lowers = field_name.lower()
-        for sep in [" need", " with", " for", " in", " that", " which", " options"]:
-            idx = lowers.find(sep)
-            if idx > 0:
-                field_name = field_name[:idx]
-                break
+        idx = _name_cut(field_name)
+        if idx > 0:
+            field_name = field_name[:idx]
         field_name = field_name.strip()
-        field_name = " ".join(w.capitalize() if not w.isupper() else w for w in field_name.split())
+        field_name = " ".join([w if w.isupper() else w.capitalize() for w in field_name.split()])
         if len(field_name) > 60:
             words = field_name.split()
             field_name = " ".join(words[:6])
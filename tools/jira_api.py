@@ -6,19 +6,65 @@ from __future__ import annotations
 
 import base64
 from typing import Dict, List, Optional
+import orjson
 import requests
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from tools.base import TTLCache, TokenBucket
 
 logger = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 30
 
+# The field catalogue changes rarely; share it per Jira site for a few minutes
+# so admin webhooks don't re-download it on every request.
+FIELD_CACHE_TTL_SEC = 300
+_FIELDS_CACHE = TTLCache(maxsize=16, ttl=FIELD_CACHE_TTL_SEC)      # base_url -> raw /field list
+_DUP_CACHE = TTLCache(maxsize=1024, ttl=FIELD_CACHE_TTL_SEC)       # (base_url, name) -> result
+
+# Opt-in (JIRA_SEARCH_CACHE): duplicate checks re-run identical JQL in bursts, so
+# successful search pages can be kept briefly. Writes through this process clear
+# them; issues created elsewhere can stay invisible for up to the TTL. Pages are
+# stored serialized so every hit hands out a fresh copy callers may mutate.
+SEARCH_CACHE_TTL_SEC = 60
+_SEARCH_CACHE = TTLCache(maxsize=256, ttl=SEARCH_CACHE_TTL_SEC)    # (base_url, jql, start, max, fields) -> page bytes
+
+# One keep-alive pool per client, sized for the webhook worker threads plus the
+# rules' concurrent page fetches/writes (requests' default keeps only 10).
+HTTP_POOL_MAXSIZE = 32
+# Retry transient failures on idempotent verbs only (never POST: comments etc.)
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "PUT", "DELETE", "HEAD"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# Jira Cloud's bulk edit endpoint limit per request
+BULK_EDIT_MAX_ISSUES = 1000
+
 class JiraAPI:
     def __init__(self, config):
         self.base_url = config.jira_base_url.rstrip("/")
         self.email: Optional[str] = getattr(config, "jira_email", None)
         self.api_token: Optional[str] = getattr(config, "jira_api_token", None)         # Cloud (Basic)
         self.bearer_token: Optional[str] = getattr(config, "jira_bearer_token", None)   # Server/DC (PAT)
+        # Writes (POST/PUT) draw from this bucket: bursts go straight through and
+        # only slow down once the sustained rate is exceeded or Jira answers 429.
+        self.search_cache: bool = bool(getattr(config, "jira_search_cache", False))
+        self.rate_limiter = TokenBucket(
+            rate=getattr(config, "jira_write_rate", 10.0),
+            capacity=getattr(config, "jira_write_burst", 20),
+        )
+
+        # Every call goes through this one session so TCP/TLS connections are reused
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=_RETRY)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
         # Auth selection: prefer Cloud Basic when email+api_token present.
         if self.email and self.api_token:
@@ -53,10 +99,23 @@ class JiraAPI:
         return self.session.get(f"{self.base_url}{path}", timeout=DEFAULT_TIMEOUT, **kw)
 
     def _post(self, path: str, **kw):
-        return self.session.post(f"{self.base_url}{path}", timeout=DEFAULT_TIMEOUT, **kw)
+        self.rate_limiter.acquire()
+        return self._throttled(self.session.post(f"{self.base_url}{path}", timeout=DEFAULT_TIMEOUT, **kw))
 
     def _put(self, path: str, **kw):
-        return self.session.put(f"{self.base_url}{path}", timeout=DEFAULT_TIMEOUT, **kw)
+        self.rate_limiter.acquire()
+        return self._throttled(self.session.put(f"{self.base_url}{path}", timeout=DEFAULT_TIMEOUT, **kw))
+
+    def _throttled(self, resp):
+        """On 429, hold all further writes for Retry-After seconds (default 5)."""
+        if resp.status_code == 429:
+            try:
+                wait = float(resp.headers.get("Retry-After", 5))
+            except (TypeError, ValueError):
+                wait = 5.0
+            logger.warning(f"Jira rate limited writes; pausing {wait:.1f}s")
+            self.rate_limiter.pause(wait)
+        return resp
 
     # -------------- public API ---------------
     def test_connection(self) -> Dict:
@@ -91,22 +150,62 @@ class JiraAPI:
             payload = {"fields": fields}
             response = self._put(f"/rest/api/3/issue/{issue_key}", json=payload)
             if response.status_code == 204:
+                self._invalidate_search_cache()
                 return {"success": True}
             elif response.status_code == 200:
+                self._invalidate_search_cache()
                 return {"success": True, "data": response.json()}
             else:
                 return {"error": f"HTTP {response.status_code}: {response.text[:300]}"}
         except Exception as e:
             return {"error": str(e)}
 
-    def get_all_custom_fields(self) -> Dict:
-        """Get all custom fields in the Jira instance"""
-        try:
-            url = "/rest/api/3/field"
-            logger.info("Fetching all custom fields...")
-            response = self._get(url)
+    def _invalidate_search_cache(self) -> None:
+        # Writes can move issues in/out of a JQL result (labels, comments, fields)
+        _SEARCH_CACHE.clear()
+
+    def _invalidate_field_caches(self) -> None:
+        _FIELDS_CACHE.pop(self.base_url)
+        _DUP_CACHE.clear()
+
+    def _all_fields(self) -> List[Dict]:
+        """Raw /field list (system + custom), cached per site for FIELD_CACHE_TTL_SEC."""
+        fields = _FIELDS_CACHE.get(self.base_url)
+        if fields is None:
+            logger.info("Fetching all fields...")
+            response = self._get("/rest/api/3/field")
             response.raise_for_status()
             fields = response.json()
+            _FIELDS_CACHE.set(self.base_url, fields)
+        return fields
+
+    def resolve_field_ids(self, names: List[str]) -> Dict[str, str]:
+        """
+        Map field names (case-insensitive) or IDs to field IDs, e.g.
+        {"Story Points": "customfield_10016", "labels": "labels"}.
+        Names that don't resolve are left out; on error the result is empty.
+        """
+        try:
+            fields = self._all_fields()
+        except Exception as e:
+            logger.error(f"Failed to resolve field ids: {e}")
+            return {}
+        by_id = {f.get("id"): f.get("id") for f in fields if f.get("id")}
+        by_name: Dict[str, str] = {}
+        for f in fields:
+            if f.get("id") and f.get("name"):
+                by_name.setdefault(f["name"].casefold(), f["id"])
+        out: Dict[str, str] = {}
+        for n in names:
+            fid = by_id.get(n) or by_name.get(n.casefold())
+            if fid:
+                out[n] = fid
+        return out
+
+    def get_all_custom_fields(self) -> Dict:
+        """Get all custom fields in the Jira instance (cached per site for FIELD_CACHE_TTL_SEC)"""
+        try:
+            fields = self._all_fields()
             custom_fields = [f for f in fields if f.get("custom", False)]
             logger.info(f"Found {len(custom_fields)} custom fields in Jira")
             return {"success": True, "fields": custom_fields}
@@ -117,11 +216,16 @@ class JiraAPI:
     def check_duplicate_field(self, field_name: str) -> Dict:
         """Check if a custom field with similar name already exists"""
         try:
+            field_name_lower = field_name.lower().strip()
+            cache_key = (self.base_url, field_name_lower)
+            cached = _DUP_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+
             all_fields = self.get_all_custom_fields()
             if "error" in all_fields:
                 return all_fields
 
-            field_name_lower = field_name.lower().strip()
             duplicates = []
             similar = []
 
@@ -134,12 +238,14 @@ class JiraAPI:
                     similar.append({"id": field_id, "name": field.get("name", ""), "type": "similar"})
 
             logger.info(f"duplicate_field: exact={len(duplicates)} similar={len(similar)}")
-            return {
+            result = {
                 "success": True,
                 "duplicates": duplicates,
                 "similar": similar,
                 "total_checked": len(all_fields["fields"]),
             }
+            _DUP_CACHE.set(cache_key, result)
+            return result
         except Exception as e:
             logger.error(f"Failed to check duplicates: {e}")
             return {"error": str(e)}
@@ -176,6 +282,7 @@ class JiraAPI:
                 field_data = response.json()
                 field_id = field_data.get("id")
                 logger.info(f"Field created successfully id={field_id}")
+                self._invalidate_field_caches()
 
                 if options and "select" in jira_field_type and field_id:
                     logger.info(f"Adding {len(options)} options to select field...")
@@ -255,6 +362,7 @@ class JiraAPI:
 
             if response.status_code == 201:
                 logger.info("Comment added successfully")
+                self._invalidate_search_cache()
                 return {"success": True, "comment_id": response.json().get("id")}
             else:
                 logger.error(f"Comment failed: {response.text[:500]}")
@@ -282,10 +390,15 @@ class JiraAPI:
         max_results: int = 50,
         start_at: int = 0,
         fields: list[str] | None = None,
+        next_page_token: str | None = None,
     ) -> dict:
         """
         Jira Cloud 2025+:
         Use GET /rest/api/3/search/jql with query params.
+        The endpoint is cursor-paginated: pass the previous page's
+        `next_page_token` to continue (start_at is only sent without a token).
+        `total` is only set when Jira reports it.
+        With JIRA_SEARCH_CACHE on, successful pages are cached for SEARCH_CACHE_TTL_SEC.
         """
         try:
             url = "/rest/api/3/search/jql"
@@ -294,12 +407,22 @@ class JiraAPI:
                 "created", "status", "reporter"
             ]
             field_list = fields if fields is not None else default_fields
+            cache_key = None
+            if self.search_cache:
+                cache_key = (self.base_url, jql, int(start_at), int(max_results), tuple(field_list), next_page_token)
+                cached = _SEARCH_CACHE.get(cache_key)
+                if cached is not None:
+                    logger.info(f"JQL search (cached): {jql}")
+                    return orjson.loads(cached)
             params = {
                 "jql": jql,
-                "startAt": str(max(0, int(start_at))),
                 "maxResults": str(max(1, int(max_results))),
                 "fields": ",".join(field_list),
             }
+            if next_page_token:
+                params["nextPageToken"] = next_page_token
+            else:
+                params["startAt"] = str(max(0, int(start_at)))
 
             logger.info(f"JQL search: {jql}")
             resp = self._get(url, params=params)
@@ -310,9 +433,19 @@ class JiraAPI:
 
             data = resp.json()
             issues = data.get("issues", [])
-            total = data.get("total", len(issues))
-            logger.info(f"Found {total} issues (returned {len(issues)})")
-            return {"success": True, "issues": issues, "total": total}
+            total = data.get("total")
+            token = data.get("nextPageToken")
+            logger.info(f"JQL search returned {len(issues)} issues (total={total}, more={bool(token)})")
+            result = {
+                "success": True,
+                "issues": issues,
+                "total": total,
+                "next_page_token": token,
+                "is_last": bool(data.get("isLast", not token)),
+            }
+            if cache_key is not None:
+                _SEARCH_CACHE.set(cache_key, orjson.dumps(result))
+            return result
         except Exception as e:
             logger.error(f"JQL search exception: {e}")
             return {"error": str(e), "jql": jql}
@@ -320,23 +453,49 @@ class JiraAPI:
     # ---------- extras used by rules ----------
     def add_label(self, issue_key: str, label: str) -> Dict:
         """
-        Add a label to an issue (union-style).
+        Add a label to an issue (union-style). Uses the edit `update.labels.add`
+        operation, so Jira merges it server-side: one PUT, no read-modify-write.
         """
         try:
-            # Get current labels
-            issue = self.get_issue(issue_key)
-            if "error" in issue:
-                return issue
-            fields = issue.get("fields", {})
-            current = list(fields.get("labels") or [])
-            if label in current:
-                return {"success": True, "labels": current}
-            new_labels = current + [label]
-            payload = {"fields": {"labels": new_labels}}
+            payload = {"update": {"labels": [{"add": label}]}}
             resp = self._put(f"/rest/api/3/issue/{issue_key}", json=payload)
             if resp.status_code in (200, 204):
-                return {"success": True, "labels": new_labels}
+                self._invalidate_search_cache()
+                return {"success": True}
             return {"error": f"HTTP {resp.status_code}: {resp.text[:200]}"}
         except Exception as e:
             logger.error(f"add_label error: {e}")
             return {"error": str(e)}
+
+    def bulk_add_label(self, issue_keys: List[str], label: str) -> Dict:
+        """
+        Add a label to many issues with one bulk-edit request (Jira Cloud,
+        up to BULK_EDIT_MAX_ISSUES keys). Jira applies the edit asynchronously
+        and returns a task id: success means the task was accepted, not that
+        the labels are already written (searches may lag until it completes).
+        """
+        if not issue_keys:
+            return {"success": True, "task_id": None}
+        if len(issue_keys) > BULK_EDIT_MAX_ISSUES:
+            return {"error": f"bulk edit accepts at most {BULK_EDIT_MAX_ISSUES} issues"}
+        try:
+            payload = {
+                "selectedIssueIdsOrKeys": list(issue_keys),
+                "selectedActions": ["labels"],
+                "editedFieldsInput": {
+                    "labelsFields": [{
+                        "fieldId": "labels",
+                        "bulkEditMultiSelectFieldOption": "ADD",
+                        "labels": [{"name": label}],
+                    }]
+                },
+                "sendBulkNotification": False,
+            }
+            resp = self._post("/rest/api/3/bulk/issues/fields", json=payload)
+            if resp.status_code in (200, 201):
+                self._invalidate_search_cache()
+                return {"success": True, "task_id": (resp.json() or {}).get("taskId")}
+            return {"error": f"HTTP {resp.status_code}: {resp.text[:200]}"}
+        except Exception as e:
+            logger.error(f"bulk_add_label error: {e}")
+            return {"error": str(e)}
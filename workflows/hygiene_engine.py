@@ -7,9 +7,12 @@ Zero-AI rule runner for Jira hygiene checks.
 
 Goals
 - Additive: lives alongside the existing FastAPI app (no breaking changes)
-- Clear: register rule objects and run them in order
+- Clear: register rule objects; results are reported in registration order
+- Bounded: independent rules run concurrently (max_concurrency)
 - Testable: deterministic inputs/outputs; no globals
 - Extensible: add rules via flags or at runtime with `add_rule()`
+- Incremental: `since=` narrows the missing-fields / workflow sweeps to recently
+  updated issues (the stale rule looks for *un*-updated issues, so it never is)
 
 Rules included:
   ✓ StaleTicketRule
@@ -18,9 +21,10 @@ Rules included:
   ✓ DuplicateCustomFieldsRule
 """
 
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, FrozenSet, List, Optional
 from core.logging import logger
-from core.config import Config
+from core.config import Config, get_config
 
 # direct imports so we can toggle per-rule easily
 from rules.missing_fields import MissingFieldsRule
@@ -40,6 +44,7 @@ def _build_rules(
     stale_add_comment: bool,
     missing_fields_add_comment: bool,
     workflow_add_comment: bool,
+    since: Optional[str] = None,
 ) -> List[BaseRule]:
     """Build the list of rule instances based on which ones are enabled."""
     rules: List[BaseRule] = []
@@ -59,6 +64,7 @@ def _build_rules(
                 required=["Assignee"],  # adjust default list as needed
                 projects=projects,
                 add_comment=missing_fields_add_comment,
+                since=since,
             )
         )
 
@@ -69,6 +75,7 @@ def _build_rules(
                 projects=projects,
                 require_assignee=True,
                 add_comment=workflow_add_comment,
+                since=since,
             )
         )
 
@@ -102,8 +109,12 @@ class HygieneEngine:
         missing_fields_add_comment: bool = False,
         workflow_add_comment: bool = False,
         config: Optional[Config] = None,
+        max_concurrency: int = 4,
+        since: Optional[str] = None,
     ):
-        self.config = config or Config()
+        self.config = config or get_config()
+        # Rules are independent JQL sweeps; run up to this many at once
+        self.max_concurrency = max(1, max_concurrency)
 
         # Keep a copy for meta + JQL construction in rules
         self.projects: List[str] = list(projects or [])
@@ -117,7 +128,17 @@ class HygieneEngine:
             stale_add_comment=stale_add_comment,
             missing_fields_add_comment=missing_fields_add_comment,
             workflow_add_comment=workflow_add_comment,
+            since=since,
         )
+        # eventType -> built-in rules that don't handle it, skipped without a
+        # should_run() call. Rules without handled_events, and rules appended to
+        # self.rules later (not in the table), always go through should_run().
+        scoped = [r for r in self.rules if r.handled_events is not None]
+        self._unhandled_default: FrozenSet[BaseRule] = frozenset(scoped)
+        self._unhandled_by_event: Dict[str, FrozenSet[BaseRule]] = {
+            ev: frozenset(r for r in scoped if ev not in r.handled_events)
+            for ev in set().union(*(r.handled_events for r in scoped))
+        }
         logger.info(f"HygieneEngine initialized with {len(self.rules)} rules.")
 
     def process(self, payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -142,19 +163,46 @@ class HygieneEngine:
             },
         }
 
-        for rule in self.rules:
+        # Rules known not to handle this event are skipped via the dispatch
+        # table; should_run() settles the rest inline. Rules that will execute are
+        # network-bound (search + writes), so run them side by side on a bounded
+        # pool; results keep rule registration order.
+        results: List[Optional[Dict[str, Any]]] = []
+        due: List[int] = []
+        unhandled = self._unhandled_by_event.get(str(event).lower(), self._unhandled_default)
+        for i, rule in enumerate(self.rules):
             try:
-                if rule.should_run(payload):
-                    result = rule.execute(payload)
+                if rule in unhandled:
+                    results.append({"rule": rule.name, "status": "skipped", "reason": "event_not_handled"})
+                elif rule.should_run(payload):
+                    due.append(i)
+                    results.append(None)
                 else:
-                    result = {
-                        "rule": rule.name,
-                        "status": "skipped",
-                        "reason": "should_run=false",
-                    }
+                    results.append({"rule": rule.name, "status": "skipped", "reason": "should_run=false"})
             except Exception as e:
-                result = {"rule": rule.name, "status": "error", "error": str(e)}
-
+                results.append(self._error_result(rule, e))
+
+        workers = min(self.max_concurrency, len(due))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hygiene") as pool:
+                ran = list(pool.map(lambda i: self._run_rule(self.rules[i], payload), due))
+        else:
+            ran = [self._run_rule(self.rules[i], payload) for i in due]
+        for i, result in zip(due, ran):
+            results[i] = result
+
+        for rule, result in zip(self.rules, results):
             out["rules"][rule.name] = result
 
-        return out
\ No newline at end of file
+        return out
+
+    @staticmethod
+    def _error_result(rule: BaseRule, e: Exception) -> Dict[str, Any]:
+        return {"rule": rule.name, "status": "error", "error": str(e)}
+
+    @classmethod
+    def _run_rule(cls, rule: BaseRule, payload: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            return rule.execute(payload)
+        except Exception as e:
+            return cls._error_result(rule, e)
@@ -2,8 +2,10 @@
 from __future__ import annotations
 from typing import Any, Dict, Optional
 
-from core.config import Config
+from core.clients import get_jira
+from core.config import Config, get_config
 from core.logging import logger
+from llm.provider import LLMProvider
 
 # reuse your existing agent flows so nothing else needs to change
 from llm.agents.l1_triage_bot import process_ticket as _process_l1
@@ -19,7 +21,12 @@ class LLMEngine:
 
     def __init__(self, *, agent: str = "l1_triage", config: Optional[Config] = None):
         self.agent = agent
-        self.config = config or Config()
+        self.config = config or get_config()
+        # Shared clients handed to the agents, which otherwise build their own
+        # JiraAPI (a /myself probe) and LLMProvider on every call. Without Jira
+        # settings get_jira() is None and the agent falls back to its own client.
+        self.jira = get_jira()
+        self.llm = LLMProvider(self.config)
         logger.info(f"LLMEngine initialized agent={self.agent}")
 
     def process(self, payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -32,11 +39,11 @@ class LLMEngine:
         logger.info(f"LLMEngine.process agent={self.agent} key={key}")
 
         if self.agent == "l1_triage":
-            return _process_l1(key, issue, self.config)
+            return _process_l1(key, issue, self.config, jira=self.jira, llm=self.llm)
         elif self.agent == "admin_validator":
-            return _process_admin(key, issue, self.config)
+            return _process_admin(key, issue, self.config, jira=self.jira, llm=self.llm)
         elif self.agent == "jira_architect":
-            return _process_architect(key, issue, self.config)
+            return _process_architect(key, issue, self.config, jira=self.jira, llm=self.llm)
         else:
             return {"success": False, "error": f"unknown agent '{self.agent}'"}
 
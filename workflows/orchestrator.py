@@ -1,14 +1,26 @@
 # workflows/orchestrator.py
 from __future__ import annotations
+import math
+import os
+import time
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
-from core.config import Config
+import orjson
+
+from core.config import Config, get_config
 from core.logging import logger
 
 from workflows.hygiene_engine import HygieneEngine
 from workflows.llm_engine import LLMEngine
 
 
+@lru_cache(maxsize=8)
+def _llm_engine(agent: str, cfg: Config) -> LLMEngine:
+    """One LLMEngine (and its shared Jira/LLM clients) per agent + Config."""
+    return LLMEngine(agent=agent, config=cfg)
+
+
 def run_full(
     payload: Dict[str, Any],
     *,
@@ -25,6 +37,7 @@ def run_full(
     stale_add_comment: bool = False,
     missing_fields_add_comment: bool = False,
     workflow_add_comment: bool = False,
+    since: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     One entry point to orchestrate engines:
@@ -32,7 +45,7 @@ def run_full(
       - mode="llm":   only llm agent
       - mode="both":  run hygiene then llm
     """
-    cfg = config or Config()
+    cfg = config or get_config()
     mode = (mode or "both").lower()
     out: Dict[str, Any] = {"mode": mode}
 
@@ -49,11 +62,88 @@ def run_full(
             missing_fields_add_comment=missing_fields_add_comment,
             workflow_add_comment=workflow_add_comment,
             config=cfg,
+            since=since,
         )
         out["rules"] = hygiene.process(payload)
 
     if mode in {"llm", "both"}:
-        llm = LLMEngine(agent=llm_agent, config=cfg)
-        out["llm"] = llm.process(payload)
+        out["llm"] = _llm_engine(llm_agent, cfg).process(payload)
+
+    return out
+
+
+# Re-scan a little before the last sweep so clock skew / slow writes aren't missed
+SWEEP_OVERLAP_MIN = 5
+
+
+class Orchestrator:
+    """
+    Scheduled sweep runner (see scripts/run_daily_sweep.py).
+
+    Remembers when the last successful sweep started (JSON state file) and
+    passes `since` to the rules as a relative JQL offset ("-<N>m"), so later
+    sweeps only page through issues updated since then. Relative minutes avoid
+    any server/user timezone mismatch in absolute JQL dates.
+    """
+
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        *,
+        mode: str = "rules",
+        projects: Optional[list[str]] = None,
+        state_path: Optional[str] = None,
+        incremental: bool = True,
+    ):
+        self.config = config or get_config()
+        self.mode = mode
+        self.projects = projects or list(getattr(self.config, "HYGIENE_DEFAULT_PROJECTS", []) or [])
+        self.state_path = state_path or getattr(self.config, "sweep_state_path", ".sweep_state.json")
+        self.incremental = incremental
+
+    def _load_state(self) -> Dict[str, Any]:
+        try:
+            with open(self.state_path, "rb") as fh:
+                state = orjson.loads(fh.read())
+            return state if isinstance(state, dict) else {}
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+
+    def _save_state(self, state: Dict[str, Any]) -> None:
+        tmp = f"{self.state_path}.tmp"
+        with open(tmp, "wb") as fh:
+            fh.write(orjson.dumps(state))
+        os.replace(tmp, self.state_path)  # atomic: a crash never leaves half a file
+
+    def _since(self, state: Dict[str, Any], now: float) -> Optional[str]:
+        last = state.get("last_sweep_ts")
+        if not self.incremental or not isinstance(last, (int, float)) or last >= now:
+            return None
+        minutes = math.ceil((now - last) / 60) + SWEEP_OVERLAP_MIN
+        return f"-{minutes}m"
+
+    def run(self, payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        started = time.time()
+        state = self._load_state()
+        since = self._since(state, started)
+        logger.info(f"orchestrator.run since={since or 'full'} state={self.state_path}")
+
+        out = run_full(
+            payload or {"eventType": "scheduled_sweep"},
+            mode=self.mode,
+            config=self.config,
+            projects=self.projects,
+            since=since,
+        )
+        out["since"] = since
 
-    return out
\ No newline at end of file
+        # Only advance the cursor when every rule really ran (no errors, no dry
+        # runs); otherwise the next run re-covers this window.
+        rule_results = ((out.get("rules") or {}).get("rules") or {}).values()
+        if not any(r.get("status") in ("error", "dry_run") for r in rule_results):
+            state["last_sweep_ts"] = started
+            try:
+                self._save_state(state)
+            except OSError as e:
+                logger.warning(f"orchestrator: could not persist sweep state: {e}")
+        return out